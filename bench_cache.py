@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of benchmark results.
+
+Every result is stored under a key hashed from the benchmarked source files,
+the interpreter or compiler version, the host, and the data point itself
+(e.g. method and n). Editing fibonacci.py, switching compilers or moving to
+another machine therefore invalidates exactly the affected points, while a
+re-run of an unchanged tree reuses them. Results are appended to a JSON-lines
+file as soon as they are measured, so an interrupted sweep resumes where it
+stopped. Failed runs (TIMEOUT, ERROR) are not cached: they may be down to a
+busy host, so the next run measures them again.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+
+CACHE_DIR = ".bench_cache"
+# Results that are retried by the next run instead of being cached
+UNCACHED_RESULTS = ("TIMEOUT", "ERROR")
+
+
+def file_hash(path):
+    """sha256 hex digest of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def python_version():
+    return f"{platform.python_implementation()} {sys.version}"
+
+
+def compiler_version(compiler):
+    """First line of `compiler --version`, or "unknown" if it cannot be run."""
+    try:
+        result = subprocess.run([compiler, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    lines = result.stdout.splitlines()
+    return lines[0] if lines else "unknown"
+
+
+def host_id():
+    return f"{platform.node()} {platform.machine()} {platform.processor()}"
+
+
+class ResultCache:
+    """
+    Maps data points to cached results for one benchmark setup.
+
+    Args:
+        name (str): Cache file name inside CACHE_DIR (e.g. "python")
+        sources (list): Paths whose contents the results depend on
+        version (str): Interpreter or compiler version string
+        directory (str): Where the cache file lives
+    """
+
+    def __init__(self, name, sources, version, directory=CACHE_DIR):
+        self.path = os.path.join(directory, f"{name}.jsonl")
+        digest = hashlib.sha256()
+        for source in sources:
+            digest.update(file_hash(source).encode())
+        digest.update(version.encode())
+        digest.update(host_id().encode())
+        self._setup = digest.hexdigest()
+        self._results = {}
+        self._torn = False  # the file ends in a partial line
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    self._torn = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut short by an interrupted run
+                    if entry["result"] not in UNCACHED_RESULTS:  # written by older versions
+                        self._results[entry["key"]] = entry["result"]
+
+    def key(self, *point):
+        """Cache key for a data point, e.g. key("inprocess", "dp", 30)."""
+        return hashlib.sha256(json.dumps([self._setup, *point]).encode()).hexdigest()
+
+    def get(self, *point):
+        """The cached result for a data point, or None."""
+        return self._results.get(self.key(*point))
+
+    def put(self, result, *point):
+        """Stores a result and appends it to the cache file right away (failures are not stored)."""
+        if result in UNCACHED_RESULTS:
+            return
+        key = self.key(*point)
+        self._results[key] = result
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a") as f:
+            if self._torn:
+                f.write("\n")
+                self._torn = False
+            f.write(json.dumps({"key": key, "point": list(point), "result": result}) + "\n")
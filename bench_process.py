@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+End-to-end measurement of single program invocations.
+
+Each run records the wall time from just before the process is spawned to its
+exit, together with the child's own resource usage (user/system CPU and peak
+RSS). The usage is the child's struct_rusage as returned by os.wait4 for that
+one child, rather than resource.getrusage(RUSAGE_CHILDREN), whose peak RSS is
+a maximum over every child ever reaped; so it is per-invocation even next to
+a long-lived worker.
+
+Subtracting the compute time a program reports for itself from its wall time
+gives its start-up cost: interpreter start, imports, argument parsing, exit.
+
+On Linux a child's peak RSS also includes the RSS of the process it was forked
+from (the high-water mark survives exec), so child_max_rss() spawns through a
+minimal interpreter to keep that floor at a few MB.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+STARTUP_HEADER = ["N", "Method", "Runs", "Wall", "Compute", "Startup", "User", "Sys", "MaxRSS_KB"]
+
+# Run as `python -S -c _SPAWNER cmd...`: runs cmd with stdout discarded and
+# prints its peak RSS (ru_maxrss units), exiting with its exit status
+_SPAWNER = """
+import os, sys
+pid = os.fork()
+if pid == 0:
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    os.execvp(sys.argv[1], sys.argv[1:])
+_, status, usage = os.wait4(pid, 0)
+print(usage.ru_maxrss)
+sys.exit(os.waitstatus_to_exitcode(status))
+"""
+
+
+def run_measured(cmd, timeout=None, env=None):
+    """
+    Runs cmd once and measures it.
+
+    Returns:
+        dict: stdout, returncode, wall (seconds), and the child's user and sys
+        CPU seconds and maxrss_kb (None where os.wait4 is unavailable);
+        returncode is None if the run was killed after timeout seconds
+    """
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    start = time.perf_counter()
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env)
+    killer = threading.Timer(timeout, kill) if timeout is not None else None
+    if killer is not None:
+        killer.start()
+    stdout = process.stdout.read()
+    process.stdout.close()
+    if hasattr(os, "wait4"):  # POSIX only; usage fields are None elsewhere
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    else:
+        process.wait()
+        usage = None
+    wall = time.perf_counter() - start
+    if killer is not None:
+        killer.cancel()
+    return {
+        "stdout": stdout,
+        "returncode": None if timed_out.is_set() else process.returncode,
+        "wall": wall,
+        "user": usage.ru_utime if usage else None,
+        "sys": usage.ru_stime if usage else None,
+        "maxrss_kb": _maxrss_kb(usage.ru_maxrss) if usage else None,
+    }
+
+
+def _maxrss_kb(usage):
+    # ru_maxrss is in KiB on Linux but in bytes on macOS
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def child_max_rss(cmd, timeout=None, env=None):
+    """
+    Peak RSS in KiB of one run of cmd, spawned from a minimal interpreter so
+    this process's own memory does not leak into the figure.
+
+    Returns:
+        int: KiB, or None if the run failed or rusage is unavailable
+    """
+    if not hasattr(os, "wait4"):
+        return None
+    result = run_measured([sys.executable, "-S", "-c", _SPAWNER, *cmd], timeout, env)
+    if result["returncode"] != 0:
+        return None
+    return _maxrss_kb(int(result["stdout"].split()[-1]))
+
+
+def rss_floor_kb():
+    """Peak RSS that child_max_rss() reports for a program doing nothing: its resolution."""
+    true = shutil.which("true")
+    return child_max_rss([true] if true else [sys.executable, "-S", "-c", ""])
+
+
+def time_startup(cmd, runs=5, timeout=None, env=None):
+    """
+    Runs a program that prints its own compute time (in seconds) `runs` times.
+
+    Returns:
+        dict: Runs and the median Wall, Compute, Startup (= Wall - Compute),
+        User, Sys and MaxRSS_KB, or None if any run failed
+    """
+    rows = []
+    for _ in range(runs):
+        result = run_measured(cmd, timeout, env)
+        if result["returncode"] != 0:
+            return None
+        compute = float(result["stdout"].split()[-1])
+        rows.append({
+            "Wall": result["wall"],
+            "Compute": compute,
+            "Startup": result["wall"] - compute,
+            "User": result["user"],
+            "Sys": result["sys"],
+            "MaxRSS_KB": result["maxrss_kb"],
+        })
+    summary = {"Runs": runs}
+    for column in ["Wall", "Compute", "Startup", "User", "Sys"]:
+        values = [row[column] for row in rows if row[column] is not None]
+        summary[column] = f"{statistics.median(values):.6f}" if values else ""
+    values = [row["MaxRSS_KB"] for row in rows if row["MaxRSS_KB"] is not None]
+    summary["MaxRSS_KB"] = int(statistics.median(values)) if values else ""
+    return summary
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Parallel scheduler for independent benchmark jobs.
+
+Jobs (e.g. (method, n) pairs) are spread over a process pool whose workers
+are each pinned to their own CPU core with os.sched_setaffinity, so that two
+measurements never share a core. Jobs can be dispatched in the given order
+or longest-first, and a skip hook may answer a job without running it (for
+example, when an earlier result shows it would time out); a ready hook can
+hold a job back until the results such a decision needs exist. Results come back
+as a dict, so callers write CSVs in their own deterministic order no matter
+in which order jobs finished.
+"""
+
+import os
+import queue
+from collections import deque
+from multiprocessing import Pool, Value
+
+
+def available_cores():
+    """Returns the CPU cores this process may run on, in ascending order."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(cores, counter):
+    """Pool initializer: pins each new worker to the next core in turn."""
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _next_ready(pending, results, ready, idle):
+    """Removes and returns the first pending job that is ready (any job when the pool is idle)."""
+    if ready is not None:
+        for i, job in enumerate(pending):
+            if ready(job, results):
+                del pending[i]
+                return job
+        if not idle:
+            return None
+    return pending.popleft()
+
+
+def run_jobs(jobs, func, workers=None, longest_first=False, cost=None, skip=None, on_result=None,
+             ready=None):
+    """
+    Runs func(job) for every job in a pinned process pool.
+
+    Args:
+        jobs (iterable): Hashable job descriptions
+        func (callable): Top-level (picklable) function called as func(job)
+        workers (int, optional): Pool size (default: number of available cores)
+        longest_first (bool): Dispatch jobs in decreasing cost(job) order
+        cost (callable, optional): Estimated cost of a job, required for longest_first
+        skip (callable, optional): skip(job, results) -> a result to record
+            without running the job, or None to run it; results holds the
+            jobs finished so far
+        on_result (callable, optional): on_result(job, result), called in this
+            process as soon as a job that was actually run finishes
+        ready (callable, optional): ready(job, results) -> whether the job may
+            be dispatched yet; jobs that are not are held back (in order) until
+            more jobs finish, e.g. until the points skip() predicts from exist
+
+    Returns:
+        dict: job -> result
+    """
+    cores = available_cores()
+    workers = workers or len(cores)
+    order = sorted(jobs, key=cost, reverse=True) if longest_first else list(jobs)
+    pending = deque(order)
+    results = {}
+    finished = queue.Queue()
+    in_flight = set()
+
+    with Pool(workers, initializer=_pin_worker, initargs=(cores, Value("i", 0))) as pool:
+        while pending or in_flight:
+            while pending and len(in_flight) < workers:
+                job = _next_ready(pending, results, ready, idle=not in_flight)
+                if job is None:
+                    break
+                answer = skip(job, results) if skip is not None else None
+                if answer is not None:
+                    results[job] = answer
+                    continue
+                in_flight.add(job)
+                pool.apply_async(
+                    func, (job,),
+                    callback=lambda result, job=job: finished.put((job, result, None)),
+                    error_callback=lambda error, job=job: finished.put((job, None, error)),
+                )
+            if not in_flight:
+                continue
+            job, result, error = finished.get()
+            in_flight.discard(job)
+            if error is not None:
+                raise error
+            results[job] = result
+            if on_result is not None:
+                on_result(job, result)
+    return results
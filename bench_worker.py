@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Client for the persistent benchmark workers of fibonacci.py and fibonacci.c.
+
+Both programs accept a `worker` method that reads newline-delimited JSON
+requests {"method", "n", "repeats"} on stdin and answers each with one line
+{"method", "n", "seconds": [...]}. Keeping one such process alive removes the
+interpreter/process start-up from every measurement after the first.
+
+Sample execution:
+    with Worker([sys.executable, "fibonacci.py", "worker"]) as worker:
+        worker.measure("dp", 30, repeats=10)
+"""
+
+import json
+import select
+import subprocess
+import time
+
+
+class WorkerError(RuntimeError):
+    """The worker rejected a request or exited."""
+
+
+class Worker:
+    """
+    A lazily started, long-lived worker process.
+
+    Args:
+        command (list): The worker command line, e.g. ["./fibonacci", "worker"]
+    """
+
+    def __init__(self, command):
+        self.command = command
+        self._process = None
+
+    def _start(self):
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1
+            )
+        return self._process
+
+    def measure(self, method, n, repeats=1, timeout=None):
+        """
+        Sends one request and waits for its reply.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the reply; on expiry
+                the worker is killed (it is restarted by the next request) and
+                subprocess.TimeoutExpired is raised
+
+        Returns:
+            list: Seconds per repeat
+        """
+        process = self._start()
+        request = {"method": method, "n": n, "repeats": repeats}
+        try:
+            process.stdin.write(json.dumps(request) + "\n")
+            process.stdin.flush()
+        except BrokenPipeError:
+            raise WorkerError(f"worker {self.command} exited") from None
+        if timeout is not None and not select.select([process.stdout], [], [], timeout)[0]:
+            self.close(kill=True)
+            raise subprocess.TimeoutExpired(self.command, timeout)
+        line = process.stdout.readline()
+        if not line:
+            raise WorkerError(f"worker {self.command} exited")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise WorkerError(reply["error"])
+        return reply["seconds"]
+
+    def sample(self, method, n, max_repeats, budget_s, timeout=None):
+        """
+        Takes up to max_repeats samples of (method, n) within about budget_s.
+
+        A first call is used as warm-up and to size the batch; it is kept as
+        the only sample when a second call would not fit in the budget.
+
+        Returns:
+            list: Seconds per sample
+        """
+        started = time.perf_counter()
+        first = self.measure(method, n, 1, timeout)
+        remaining = budget_s - (time.perf_counter() - started)
+        repeats = min(max_repeats, int(remaining / max(first[0], 1e-9)))
+        if repeats < 1:
+            return first
+        return self.measure(method, n, repeats, timeout)
+
+    def close(self, kill=False):
+        """Stops the worker at EOF, or at once with kill=True; a later request starts a new one."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if kill:
+            process.kill()
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
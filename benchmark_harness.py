@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+In-process, high-resolution benchmark harness for the Fibonacci engines.
+
+Replaces single time.time() shots (which mostly read 0.000000) with
+perf_counter_ns samples: a warm-up call, then repeated samples until a time
+budget or a precision target is reached. All engine caches (the DP table and
+the Pisano-period cache) are cleared before every sample, and an enabled
+on-disk checkpoint store is bypassed while sampling (unless asked for), so a
+warm cache is never measured by accident.
+
+Samples outside Tukey's fences (1.5 IQR beyond the quartiles) are rejected as
+outliers, e.g. a sample interrupted by the scheduler; the median, IQR and a
+bootstrap confidence interval of the median are reported from the rest.
+
+Sample execution:
+    python benchmark_harness.py --methods iterative dp --start 1 --stop 40 --out timings_fib_python_stats.csv
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+import statistics
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the bootstrap
+    np = None
+
+import fibonacci
+from fib_ops import ENGINES
+
+DEFAULT_BUDGET_S = 0.2
+MIN_SAMPLES = 15
+MAX_SAMPLES = 10000
+TARGET_REL_ERROR = 0.01
+OUTLIER_FENCE = 1.5
+CONFIDENCE = 0.95
+BOOTSTRAP_RESAMPLES = 1000
+# Per (method, n): sample counts, then seconds
+STATS_COLUMNS = ["Samples", "Kept", "Min", "Median", "P95", "Q1", "Q3", "IQR", "CI_Low", "CI_High"]
+STATS_HEADER = ["N", "Method"] + STATS_COLUMNS
+
+
+def reset_caches():
+    """Clears every cache an engine could reuse between samples."""
+    fibonacci.fib_dp.reset()
+    fibonacci.pisano_period.cache_clear()
+
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile q (0-100) of an already sorted list."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def reject_outliers(sorted_values, fence=OUTLIER_FENCE):
+    """Drops values more than fence * IQR outside the quartiles (Tukey's fences)."""
+    q1 = percentile(sorted_values, 25)
+    q3 = percentile(sorted_values, 75)
+    low = q1 - fence * (q3 - q1)
+    high = q3 + fence * (q3 - q1)
+    return [v for v in sorted_values if low <= v <= high]
+
+
+def bootstrap_ci(values, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Percentile-bootstrap confidence interval of the median.
+
+    The resampling is seeded, so the same samples always give the same interval.
+
+    Returns:
+        tuple: (low, high)
+    """
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        picks = rng.integers(0, len(values), size=(resamples, len(values)))
+        medians = np.sort(np.median(np.asarray(values, dtype=float)[picks], axis=1)).tolist()
+    else:
+        rng = random.Random(seed)
+        medians = sorted(
+            statistics.median(rng.choices(values, k=len(values))) for _ in range(resamples)
+        )
+    tail = (1 - confidence) / 2 * 100
+    return percentile(medians, tail), percentile(medians, 100 - tail)
+
+
+def summarize(samples):
+    """
+    Summarizes raw samples after outlier rejection.
+
+    Returns:
+        dict: samples and kept (counts), min and p95 over all samples, and
+        median, q1, q3, iqr, ci_low, ci_high over the kept samples
+    """
+    samples = sorted(samples)
+    kept = reject_outliers(samples)
+    q1 = percentile(kept, 25)
+    q3 = percentile(kept, 75)
+    ci_low, ci_high = bootstrap_ci(kept)
+    return {
+        "samples": len(samples),
+        "kept": len(kept),
+        "min": samples[0],
+        "median": statistics.median(kept),
+        "p95": percentile(samples, 95),
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+    }
+
+
+def stats_cells(stats, suffix="_ns", scale=1e9):
+    """
+    Formats timing statistics as STATS_COLUMNS cells in seconds.
+
+    The defaults read a measure() result (nanosecond keys); pass suffix=""
+    and the unit's scale for a plain summarize() result.
+    """
+    cells = [stats["samples"], stats["kept"]]
+    for key in ("min", "median", "p95", "q1", "q3", "iqr", "ci_low", "ci_high"):
+        cells.append(f"{stats[key + suffix] / scale:.9f}")
+    return dict(zip(STATS_COLUMNS, cells))
+
+
+def _timed_call(func, n):
+    reset_caches()
+    start = time.perf_counter_ns()
+    func(n)
+    return time.perf_counter_ns() - start
+
+
+def measure(func, n, budget_s=DEFAULT_BUDGET_S, min_samples=MIN_SAMPLES,
+            max_samples=MAX_SAMPLES, target_rel_error=TARGET_REL_ERROR, use_checkpoints=False):
+    """
+    Measures func(n), resetting caches before each sample and, unless
+    use_checkpoints is set, bypassing any checkpoint store enabled with
+    fibonacci.use_checkpoints().
+
+    After one warm-up call, samples are taken until at least min_samples
+    exist and the relative standard error of the mean drops below
+    target_rel_error, or until budget_s seconds of wall-clock time have
+    passed, or max_samples is reached. A warm-up that alone uses up the
+    budget (e.g. fib_recursive at large n) is kept as the only sample.
+    Outliers are rejected before the median, quartiles and confidence
+    interval are computed (see summarize()).
+
+    Args:
+        func (callable): The engine to time, called as func(n)
+        n (int): The Fibonacci index
+        budget_s (float): Wall-clock budget for the whole measurement
+        use_checkpoints (bool): Let func resume from the checkpoint store
+            (warm-checkpoint mode); meant for a single sample per process,
+            since later samples would resume from the first one's checkpoint
+
+    Returns:
+        dict: samples, kept, and min_ns, median_ns, p95_ns, q1_ns, q3_ns,
+        iqr_ns, ci_low_ns, ci_high_ns (times in nanoseconds)
+    """
+    # a checkpoint store would turn every sample after the first into a disk read
+    checkpoints = fibonacci._checkpoints
+    if not use_checkpoints:
+        fibonacci.use_checkpoints(None)
+    try:
+        samples = _sample(func, n, budget_s, min_samples, max_samples, target_rel_error)
+    finally:
+        fibonacci.use_checkpoints(checkpoints)
+    summary = summarize(samples)
+    return {key if key in ("samples", "kept") else f"{key}_ns": value for key, value in summary.items()}
+
+
+def _sample(func, n, budget_s, min_samples, max_samples, target_rel_error):
+    deadline = time.perf_counter_ns() + int(budget_s * 1e9)
+    warmup = _timed_call(func, n)
+    samples = [warmup] if time.perf_counter_ns() >= deadline else []
+    mean = m2 = 0.0  # running mean and sum of squared deviations (Welford)
+    while time.perf_counter_ns() < deadline and len(samples) < max_samples:
+        sample = _timed_call(func, n)
+        samples.append(sample)
+        delta = sample - mean
+        mean += delta / len(samples)
+        m2 += delta * (sample - mean)
+        if len(samples) >= max(min_samples, 2):
+            stderr = math.sqrt(m2 / (len(samples) - 1) / len(samples))
+            if mean == 0 or stderr / mean < target_rel_error:
+                break
+    return samples
+
+
+def measure_method(method, n, cells=False, **kwargs):
+    """
+    Measures one of the ENGINES by its fibonacci.py method name.
+
+    With cells=True, returns the STATS_COLUMNS cells (seconds) instead.
+    """
+    stats = measure(getattr(fibonacci, ENGINES[method]), n, **kwargs)
+    return stats_cells(stats) if cells else stats
+
+
+def run_sweep(methods, n_values, out_file, budget_s=DEFAULT_BUDGET_S):
+    """Writes the STATS_HEADER columns (times in seconds) per (method, n) to out_file."""
+    with open(out_file, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=STATS_HEADER)
+        writer.writeheader()
+        for n in n_values:
+            for method in methods:
+                writer.writerow({"N": n, "Method": method, **measure_method(method, n, budget_s=budget_s, cells=True)})
+
+
+def recursive_scaling(n, worker_counts):
+    """
+    Times fib_recursive_parallel(n) for each worker count against the
+    single-process fib_recursive(n). One pool is created per worker count
+    and reused across samples, so pool start-up is not part of the timings.
+
+    Returns:
+        list: (workers, seconds, speedup) tuples, workers=0 being the serial baseline
+    """
+    from multiprocessing import Pool
+
+    baseline = measure(fibonacci.fib_recursive, n, min_samples=3)["median_ns"]
+    rows = [(0, baseline / 1e9, 1.0)]
+    for workers in worker_counts:
+        with Pool(workers) as pool:
+            parallel = measure(
+                lambda k: fibonacci.fib_recursive_parallel(k, workers, pool=pool), n, min_samples=3
+            )["median_ns"]
+        rows.append((workers, parallel / 1e9, baseline / parallel))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Fibonacci engines in-process")
+    parser.add_argument("--methods", nargs="+", choices=list(ENGINES), default=["iterative", "recursive", "dp"])
+    parser.add_argument("--start", type=int, default=1, help="the first n")
+    parser.add_argument("--stop", type=int, default=30, help="the last n (inclusive)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_S, help="seconds per (method, n)")
+    parser.add_argument("--out", type=str, default="timings_fib_python_stats.csv", help="the output file name")
+    parser.add_argument(
+        "--scaling", type=int, default=None, metavar="N",
+        help="instead of the sweep, report parallel fib_recursive(N) speedup for 1..cpu_count workers"
+    )
+    args = parser.parse_args()
+    if args.scaling is not None:
+        print("Workers,Seconds,Speedup")
+        for workers, seconds, speedup in recursive_scaling(args.scaling, range(1, (os.cpu_count() or 1) + 1)):
+            print(f"{workers},{seconds:.6f},{speedup:.2f}")
+    else:
+        run_sweep(args.methods, range(args.start, args.stop + 1), args.out, args.budget)
@@ -1,66 +1,161 @@
 #!/usr/bin/env python3
 """
 Collect actual timing data from C implementation instead of simulation.
+
+Sample execution:
+    python c_timing_collector.py                # repeated calls timed inside the C program
+    python c_timing_collector.py --mode worker  # through one persistent C worker
+    python c_timing_collector.py --mode ctypes  # in-process, through the shared library
 """
 
+import argparse
 import subprocess
 import csv
-import os
-
-def collect_c_timings():
-    """Collect actual timing data from compiled C program."""
-
-    gcc_path = r"C:\Users\joshc\Downloads\gcc-15.2.0-gdb-16.3.90.20250511-binutils-2.45-mingw-w64-v13.0.0-ucrt\bin\gcc.exe"
-    exe_path = "fibonacci.exe"
-
-    # Compile if needed
-    if not os.path.exists(exe_path):
-        result = subprocess.run([gcc_path, "fibonacci.c", "-o", exe_path],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Compilation failed: {result.stderr}")
-            return
+import time
+
+from bench_cache import ResultCache, compiler_version
+from bench_process import STARTUP_HEADER, time_startup
+from bench_worker import Worker, WorkerError
+import fib_native
+from fib_native import build_executable, find_compiler
+from memory_profile import collect_c_memory
+from benchmark_harness import STATS_HEADER, stats_cells, summarize
+from perf_model import predict_runtime
+
+# Column -> fibonacci.c method
+TIMED_METHODS = {"Iterative": "iterative", "Recursive": "recursive", "DP": "dp"}
+# A data point predicted to take longer than this is not run
+TIME_BUDGET = 10
+# Hard cap for a single run, for the first points before a prediction exists
+RUN_TIMEOUT = 30
+# Samples per data point, summarized with outlier rejection like the Python harness
+SAMPLES = 25
+# n values and invocations per (method, n) for the start-up cost CSV
+STARTUP_N_VALUES = [1, 10, 20, 30]
+STARTUP_RUNS = 5
+MODES = ["bench", "worker", "ctypes"]
+
+def parse_bench_output(text):
+    """
+    Parses the line printed by `fibonacci bench <method> <n> [samples]`:
+        method=<m> n=<n> calls_per_sample=<c> samples=<k> ns_per_call=<v1>,...,<vk>
+
+    Returns:
+        dict: method, n, calls_per_sample, samples and ns_per_call (a list of k floats)
+
+    Raises:
+        ValueError: If the line is malformed or the sample count does not match
+    """
+    fields = dict(token.split("=", 1) for token in text.split())
+    result = {
+        "method": fields["method"],
+        "n": int(fields["n"]),
+        "calls_per_sample": int(fields["calls_per_sample"]),
+        "samples": int(fields["samples"]),
+        "ns_per_call": [float(v) for v in fields["ns_per_call"].split(",")],
+    }
+    if len(result["ns_per_call"]) != result["samples"]:
+        raise ValueError(f"expected {result['samples']} samples, got {len(result['ns_per_call'])}")
+    return result
+
+def sample_bench(exe_path, method, n):
+    """
+    SAMPLES per-call times (seconds) from the C program's bench mode, which
+    repeats short calls inside the binary until each sample lasts >= 1 ms.
+    """
+    result = subprocess.run([exe_path, "bench", method, str(n), str(SAMPLES)],
+                          capture_output=True, text=True, timeout=RUN_TIMEOUT)
+    if result.returncode != 0:
+        raise WorkerError(result.stdout.strip() or result.stderr.strip())
+    return [ns / 1e9 for ns in parse_bench_output(result.stdout)["ns_per_call"]]
+
+def sample_ctypes(method, n):
+    """
+    Up to SAMPLES in-process calls through the fib_native ctypes binding
+    within TIME_BUDGET (each sample includes the ~100 ns ctypes call overhead).
+    """
+    engine = fib_native.ENGINES[method]
+    samples = []
+    deadline = time.perf_counter() + TIME_BUDGET
+    while len(samples) < SAMPLES and time.perf_counter() < deadline:
+        start = time.perf_counter_ns()
+        engine(n)
+        samples.append((time.perf_counter_ns() - start) / 1e9)
+    return samples
+
+def time_c_method(sampler, method, n, points, cache=None, mode="worker"):
+    """
+    Summarizes sampler(method, n) (a list of seconds), unless the growth model
+    fitted to the earlier (n, seconds) points of this method predicts more
+    than TIME_BUDGET. A result cached for the same source, compiler, host and
+    mode is reused; TIMEOUT and ERROR are not cached, so they are retried.
+
+    Returns:
+        dict or str: benchmark_harness.summarize() statistics in seconds, or
+        PREDICTED:<seconds>, TIMEOUT or ERROR
+    """
+    cached = cache.get(mode, method, n, SAMPLES) if cache is not None else None
+    if cached is not None:
+        if isinstance(cached, dict):
+            points.append((n, cached["median"]))
+        return cached
+    predicted = predict_runtime(points, n)
+    if predicted is not None and predicted > TIME_BUDGET:
+        return f"PREDICTED:{predicted:.6f}"
+    try:
+        result = summarize(sampler(method, n))
+        points.append((n, result["median"]))
+    except subprocess.TimeoutExpired:
+        result = "TIMEOUT"
+    except (OSError, ValueError, KeyError, WorkerError):
+        result = "ERROR"
+    if cache is not None:
+        cache.put(result, mode, method, n, SAMPLES)
+    return result
+
+def timing_cell(result):
+    """The single timings CSV cell of a result: the median of its statistics."""
+    return result["median"] if isinstance(result, dict) else result
+
+def collect_c_timings(mode="bench"):
+    """
+    Collect actual timing data from compiled C program: with its in-binary
+    repetition mode, through one persistent worker process, or in-process
+    through the ctypes binding.
+    """
+
+    # Build with the system compiler if needed
+    try:
+        exe_path = build_executable()
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"Compilation failed: {e}")
+        return
 
     timings = []
 
     # Test different n values
     n_values = list(range(1, 41))  # 1 to 40
-
-    for n in n_values:
-        row = {"N": n}
-
-        # Test iterative
-        try:
-            result = subprocess.run([exe_path, "iterative", str(n)],
-                                  capture_output=True, text=True, timeout=30)
-            row["Iterative"] = float(result.stdout.strip()) if result.returncode == 0 else "ERROR"
-        except subprocess.TimeoutExpired:
-            row["Iterative"] = "TIMEOUT"
-        except:
-            row["Iterative"] = "ERROR"
-
-        # Test recursive (with timeout for large n)
-        try:
-            result = subprocess.run([exe_path, "recursive", str(n)],
-                                  capture_output=True, text=True, timeout=10)
-            row["Recursive"] = float(result.stdout.strip()) if result.returncode == 0 else "TIMEOUT"
-        except subprocess.TimeoutExpired:
-            row["Recursive"] = "TIMEOUT"
-        except:
-            row["Recursive"] = "TIMEOUT"
-
-        # Test DP
-        try:
-            result = subprocess.run([exe_path, "dp", str(n)],
-                                  capture_output=True, text=True, timeout=30)
-            row["DP"] = float(result.stdout.strip()) if result.returncode == 0 else "ERROR"
-        except subprocess.TimeoutExpired:
-            row["DP"] = "TIMEOUT"
-        except:
-            row["DP"] = "ERROR"
-
-        timings.append(row)
-        print(f"Completed n={n}")
+    points = {column: [] for column in TIMED_METHODS}
+    # Reuse points measured for the same fibonacci.c, compiler, build flags and host
+    toolchain = f"{compiler_version(find_compiler())} {' '.join(fib_native.OPT_FLAGS)}"
+    cache = ResultCache("c", ["fibonacci.c"], toolchain)
+
+    # One warm C process (or the loaded library) serves every measurement
+    with Worker([exe_path, "worker"]) as worker:
+        if mode == "bench":
+            sampler = lambda method, n: sample_bench(exe_path, method, n)
+        elif mode == "ctypes":
+            sampler = sample_ctypes
+        else:
+            sampler = lambda method, n: worker.sample(method, n, SAMPLES, TIME_BUDGET, timeout=RUN_TIMEOUT)
+        for n in n_values:
+            row = {"N": n}
+
+            for column, method in TIMED_METHODS.items():
+                row[column] = time_c_method(sampler, method, n, points[column], cache, mode)
+
+            timings.append(row)
+            print(f"Completed n={n}")
 
     # Write to CSV
     with open('timings_fib_c_actual.csv', 'w', newline='') as csvfile:
@@ -68,72 +163,80 @@ def collect_c_timings():
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         for row in timings:
-            writer.writerow(row)
+            writer.writerow({column: timing_cell(cell) for column, cell in row.items()})
 
-    print("Actual C timing data collected and saved to timings_fib_c_actual.csv")
+    # Full statistics per (n, method), in the same schema as the Python harness
+    with open('timings_fib_c_actual_stats.csv', 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=STATS_HEADER)
+        writer.writeheader()
+        for row in timings:
+            for column, method in TIMED_METHODS.items():
+                if isinstance(row[column], dict):
+                    writer.writerow({"N": row["N"], "Method": method,
+                                     **stats_cells(row[column], suffix="", scale=1)})
 
-def collect_c_ops():
-    """Collect operations count data from C implementation."""
+    print("Actual C timing data collected and saved to timings_fib_c_actual.csv")
 
-    gcc_path = r"C:\Users\joshc\Downloads\gcc-15.2.0-gdb-16.3.90.20250511-binutils-2.45-mingw-w64-v13.0.0-ucrt\bin\gcc.exe"
-    exe_path = "fibonacci.exe"
+def collect_c_ops(out_file='ops_fib_c_actual.csv'):
+    """
+    Collect operations count data from C implementation: the additions each
+    engine performs, counted by the engines themselves in the
+    operation-counting build of fibonacci.c (fib_native.count_ops).
+    """
+
+    # Build with the system compiler if needed
+    try:
+        fib_native.build_ops_library()
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"Compilation failed: {e}")
+        return
+
+    # Same n values and measure as ops_fib_python.csv (fib_ops.count_ops additions)
+    n_values = list(range(1, 21))  # 1 to 20 for ops count
 
-    # Compile if needed
-    if not os.path.exists(exe_path):
-        result = subprocess.run([gcc_path, "fibonacci.c", "-o", exe_path],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Compilation failed: {result.stderr}")
-            return
+    with open(out_file, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['N'] + list(TIMED_METHODS))
+        for n in n_values:
+            writer.writerow([n] + [fib_native.count_ops(method, n) for method in TIMED_METHODS.values()])
 
-    ops_data = []
+    print(f"Actual C operations data collected and saved to {out_file}")
 
-    # Test different n values for operations count
-    n_values = list(range(1, 21))  # 1 to 20 for ops count
+def collect_c_startup():
+    """Split whole-invocation wall time of the C program into start-up and compute cost."""
 
-    for n in n_values:
-        row = {"N": n}
-
-        # Test iterative ops
-        try:
-            result = subprocess.run([exe_path, "print_iter", str(n)],
-                                  capture_output=True, text=True)
-            # Extract ops count from last line
-            lines = result.stdout.strip().split('\n')
-            ops_line = [line for line in lines if line.startswith('Operations:')][0]
-            row["Iterative"] = int(ops_line.split(':')[1].strip())
-        except:
-            row["Iterative"] = "ERROR"
-
-        # Test recursive ops (simplified)
-        try:
-            row["Recursive"] = n - 1 if n > 1 else 0  # Simplified count
-        except:
-            row["Recursive"] = "ERROR"
-
-        # Test DP ops
-        try:
-            result = subprocess.run([exe_path, "print_dp", str(n)],
-                                  capture_output=True, text=True)
-            lines = result.stdout.strip().split('\n')
-            ops_line = [line for line in lines if line.startswith('Operations:')][0]
-            row["DP"] = int(ops_line.split(':')[1].strip())
-        except:
-            row["DP"] = "ERROR"
-
-        ops_data.append(row)
-        print(f"Completed ops for n={n}")
+    # Build with the system compiler if needed
+    try:
+        exe_path = build_executable()
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"Compilation failed: {e}")
+        return
 
-    # Write to CSV
-    with open('ops_fib_c_actual.csv', 'w', newline='') as csvfile:
-        fieldnames = ['N', 'Iterative', 'Recursive', 'DP']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+    # Each invocation times one call itself; the rest of its wall time is
+    # process start-up and exit
+    with open('startup_fib_c.csv', 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=STARTUP_HEADER)
         writer.writeheader()
-        for row in ops_data:
-            writer.writerow(row)
+        for n in STARTUP_N_VALUES:
+            for method in TIMED_METHODS.values():
+                summary = time_startup([exe_path, method, str(n)],
+                                       STARTUP_RUNS, RUN_TIMEOUT)
+                if summary is not None:
+                    writer.writerow({"N": n, "Method": method, **summary})
 
-    print("Actual C operations data collected and saved to ops_fib_c_actual.csv")
+    print("C start-up cost collected and saved to startup_fib_c.csv")
 
 if __name__ == "__main__":
-    collect_c_timings()
+    parser = argparse.ArgumentParser(description="Collect C Fibonacci timings, operation counts and start-up cost")
+    parser.add_argument(
+        "--mode", choices=MODES, default="bench",
+        help="bench repeats each call inside the C program for nanosecond resolution; worker "
+             "sends every data point to one persistent C process; ctypes calls the shared "
+             "library in-process (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    collect_c_timings(args.mode)
     collect_c_ops()
+    collect_c_startup()
+    collect_c_memory(build_executable(), list(TIMED_METHODS.values()))
+    print("C peak memory collected and saved to memory_fib_c.csv")
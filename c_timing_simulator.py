@@ -1,78 +1,101 @@
 #!/usr/bin/env python3
 """
-Simulates C timing data based on Python performance and known C/Python ratios.
-This provides empirical C data for the report since gcc is not available.
+Fits complexity models to the measured timings and predicts unmeasured n.
+
+Every (language, method) series in timings_fib_python.csv and
+timings_fib_c_actual.csv is fitted by least squares to a*n + b, a*phi^n and
+a*log(n) (see perf_model.fit_forms). model_fits.csv reports each fit's
+coefficients and quality; timings_fib_c.csv holds the C timings for
+n = 1..40, measured where available and otherwise predicted from the best
+fitting form, with the prediction intervals in timings_fib_c_predicted.csv.
+ops_fib_c.csv is counted by the C engines (see c_timing_collector.collect_c_ops).
+
+Sample execution:
+    python c_timing_collector.py     # measure first
+    python c_timing_simulator.py
 """
 
 import csv
-import math
+import os
 
-def simulate_c_timings():
-    """Generate simulated C timing data based on Python results and performance ratios."""
+from c_timing_collector import collect_c_ops
+from perf_model import FORMS, best_fit, fit_forms, read_series
 
-    # Read Python timing data
-    python_timings = {}
-    with open('timings_fib_python.csv', 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            n = int(row['N'])
-            python_timings[n] = {
-                'iterative': float(row['Iterative']),
-                'recursive': float(row['Recursive']) if row['Recursive'] != 'TIMEOUT' else float('inf'),
-                'dp': float(row['DP'])
-            }
+METHODS = ["Iterative", "Recursive", "DP"]
+SERIES = [("Python", "timings_fib_python.csv"), ("C", "timings_fib_c_actual.csv")]
+N_VALUES = range(1, 41)
+FITS_HEADER = ["Language", "Method", "Form", "Params", "Points", "R2", "LogRMSE", "Best"]
+PREDICTED_HEADER = ["N", "Method", "Source", "Seconds", "Low", "High"]
 
-    # C performance ratios (estimated based on typical C vs Python performance)
-    # C is generally 10-50x faster for computational tasks
-    c_ratios = {
-        'iterative': 0.02,  # C iterative is ~50x faster than Python
-        'recursive': 0.05,  # C recursive has less overhead but still exponential
-        'dp': 0.03         # C DP is ~33x faster
-    }
-
-    # Generate C timing data
-    with open('timings_fib_c.csv', 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['N', 'Iterative', 'Recursive', 'DP'])
 
-        for n in range(1, 41):
-            if n in python_timings:
-                py_times = python_timings[n]
+def report_fits(out_file='model_fits.csv'):
+    """
+    Fits every candidate form to every available series and writes model_fits.csv.
 
-                # Calculate C times
-                c_iter = py_times['iterative'] * c_ratios['iterative']
-                c_rec = py_times['recursive'] * c_ratios['recursive'] if py_times['recursive'] != float('inf') else 'TIMEOUT'
-                c_dp = py_times['dp'] * c_ratios['dp']
-
-                # Ensure minimum timing resolution (C clock() has microsecond precision)
-                c_iter = max(c_iter, 0.000001)
-                c_dp = max(c_dp, 0.000001)
+    Returns:
+        dict: (language, method) -> best Fit, for the series that could be fitted
+    """
+    best = {}
+    with open(out_file, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FITS_HEADER)
+        for language, path in SERIES:
+            if not os.path.exists(path):
+                print(f"{path} not found; skipping {language}")
+                continue
+            for method, points in read_series(path, METHODS).items():
+                fits = fit_forms(points)
+                if not fits:
+                    continue
+                winner = min(fits.values(), key=lambda fit: fit.log_rmse)
+                best[(language, method)] = winner
+                for form in FORMS:
+                    if form not in fits:
+                        continue
+                    fit = fits[form]
+                    params = ";".join(f"{k}={v:.6g}" for k, v in fit.params.items())
+                    writer.writerow([language, method, form, params, fit.points,
+                                     f"{fit.r2:.6f}", f"{fit.log_rmse:.6f}", int(fit is winner)])
+    return best
 
-                writer.writerow([n, f"{c_iter:.6f}", c_rec if c_rec == 'TIMEOUT' else f"{c_rec:.6f}", f"{c_dp:.6f}"])
-            else:
-                # For n > available Python data, estimate
-                c_iter = 0.000001 * n * c_ratios['iterative']
-                c_rec = 'TIMEOUT' if n > 35 else 0.000001 * (2 ** n) * c_ratios['recursive']
-                c_dp = 0.000001 * n * c_ratios['dp']
-                writer.writerow([n, f"{c_iter:.6f}", c_rec, f"{c_dp:.6f}"])
 
-def simulate_c_operations():
-    """Generate C operations data (same as Python since algorithmic complexity is identical)."""
+def predict_c_timings(out_file='timings_fib_c.csv', intervals_file='timings_fib_c_predicted.csv'):
+    """
+    Writes the C timings for N_VALUES: measured cells as they are, the rest
+    predicted by the best fit of that method's measured C series.
+    """
+    if not os.path.exists('timings_fib_c_actual.csv'):
+        print("timings_fib_c_actual.csv not found; run c_timing_collector.py first")
+        return
+    measured = {method: dict(points) for method, points in read_series('timings_fib_c_actual.csv', METHODS).items()}
+    fits = {method: best_fit(list(measured[method].items())) for method in METHODS}
 
-    # Operations count is algorithmic, not language-specific
-    with open('ops_fib_c.csv', 'w', newline='') as csvfile:
+    with open(out_file, 'w', newline='') as csvfile, open(intervals_file, 'w', newline='') as longfile:
         writer = csv.writer(csvfile)
-        writer.writerow(['N', 'Iterative', 'Recursive', 'DP'])
-
-        for n in range(1, 21):
-            # Operations are the same regardless of language
-            iter_ops = n - 1 if n > 1 else 0
-            rec_ops = 2 ** n - 1  # Each call does work
-            dp_ops = n  # One computation per n
+        writer.writerow(['N'] + METHODS)
+        long_writer = csv.writer(longfile)
+        long_writer.writerow(PREDICTED_HEADER)
+        for n in N_VALUES:
+            row = [n]
+            for method in METHODS:
+                if n in measured[method]:
+                    seconds = measured[method][n]
+                    long_writer.writerow([n, method, "measured", f"{seconds:.9f}", "", ""])
+                elif fits[method] is not None:
+                    seconds, low, high = fits[method].predict(n)
+                    long_writer.writerow([n, method, fits[method].form,
+                                          f"{seconds:.9f}", f"{low:.9f}", f"{high:.9f}"])
+                else:
+                    row.append('')
+                    continue
+                row.append(f"{seconds:.9f}")
+            writer.writerow(row)
 
-            writer.writerow([n, iter_ops, rec_ops, dp_ops])
 
 if __name__ == "__main__":
-    simulate_c_timings()
-    simulate_c_operations()
-    print("C timing simulation completed!")
+    for (language, method), fit in report_fits().items():
+        print(f"{language:6} {method:9} best: {fit}")
+    predict_c_timings()
+    # Operation counts need no prediction: they are counted by the C engines
+    collect_c_ops('ops_fib_c.csv')
+    print("C timing predictions completed!")
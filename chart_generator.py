@@ -1,82 +1,461 @@
 #!/usr/bin/env python3
 """
 Generates charts for Fibonacci algorithm analysis.
-Creates multiple visualizations comparing iterative, recursive, and DP approaches.
+Creates multiple visualizations comparing iterative, recursive, and DP
+approaches, in Python and in C.
+
+Every chart is declared in CHARTS with the CSV files it is drawn from. Each
+CSV is parsed once into columns (TIMEOUT, PREDICTED:<seconds> and ERROR
+cells become NaN), and the parsed columns are cached under
+.bench_cache/charts by the file's content hash. A chart is re-rendered only
+when its output is missing or the hash of its inputs (and of the code in
+CODE) differs from the one it was last rendered from; stale charts are rendered in
+parallel worker processes with the non-interactive Agg backend.
+
+Charts draw only the method columns their CSVs have, and a chart that fails
+to render is reported and left stale without stopping the others.
+
+Sample execution:
+    python chart_generator.py                  # render stale charts
+    python chart_generator.py --force          # render everything
+    python chart_generator.py c_vs_python_comparison.png
 """
 
+import argparse
+import hashlib
+import json
+import os
+import pickle
+from multiprocessing import Pool
+
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
-def generate_charts():
-    """Generate multiple charts for the report."""
+from bench_cache import CACHE_DIR, file_hash
+from bench_scheduler import available_cores
+import complexity_analysis
+import perf_model
+
+CHART_CACHE_DIR = os.path.join(CACHE_DIR, "charts")
+MANIFEST = "manifest.json"
+# The chart code: editing it makes every chart stale
+CODE = [__file__, complexity_analysis.__file__, perf_model.__file__]
+# Columns kept as text; every other column is parsed as numbers
+TEXT_COLUMNS = {"Method"}
+
+PY_TIMINGS = 'timings_fib_python.csv'
+PY_OPS = 'ops_fib_python.csv'
+PY_STATS = 'timings_fib_python_stats.csv'
+C_TIMINGS = 'timings_fib_c_actual.csv'
+C_OPS = 'ops_fib_c_actual.csv'
+C_STATS = 'timings_fib_c_actual_stats.csv'
+C_PREDICTED = 'timings_fib_c.csv'
+# Inputs a chart can do without (e.g. statistics are only drawn if collected)
+OPTIONAL_INPUTS = {PY_STATS, C_STATS}
+# (column, label, color, marker) of each method, in drawing order
+METHOD_STYLES = [
+    ('Iterative', 'Iterative', 'green', '^'),
+    ('Recursive', 'Recursive', 'red', 'o'),
+    ('DP', 'Dynamic Programming', 'blue', 's'),
+]
+
+
+def parse_csv(path):
+    """
+    Parses a CSV into {column: numpy array}, numeric columns as floats.
+
+    Returns:
+        dict: The columns, in file order
+    """
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    columns = {}
+    for name in df.columns:
+        if name in TEXT_COLUMNS:
+            columns[name] = df[name].to_numpy()
+        else:
+            columns[name] = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=float)
+    return columns
+
+
+def load_columns(path, cache_dir=CHART_CACHE_DIR):
+    """
+    parse_csv(path), reusing the parse cached for the same file contents.
 
-    # Load timing data
-    timings_df = pd.read_csv('timings_fib_python.csv')
-    ops_df = pd.read_csv('ops_fib_python.csv')
+    Returns:
+        dict: The columns, or None if path does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    cached = os.path.join(cache_dir, f"{os.path.basename(path)}.{file_hash(path)[:16]}.pkl")
+    if os.path.exists(cached):
+        with open(cached, 'rb') as f:
+            return pickle.load(f)
+    columns = parse_csv(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    for old in os.listdir(cache_dir):
+        if old.startswith(f"{os.path.basename(path)}.") and old.endswith(".pkl"):
+            os.remove(os.path.join(cache_dir, old))
+    with open(cached + ".tmp", 'wb') as f:
+        pickle.dump(columns, f)
+    os.replace(cached + ".tmp", cached)
+    return columns
+
+
+def load_stats(path):
+    """Loads a statistics CSV (benchmark_harness.STATS_HEADER), or None if it was not collected."""
+    columns = load_columns(path)
+    return None if columns is None else pd.DataFrame(columns)
+
+def plot_error_band(stats_df, method, color):
+    """Shades the confidence interval of the median for one method, if statistics exist."""
+    if stats_df is None:
+        return
+    rows = stats_df[stats_df['Method'] == method]
+    plt.fill_between(rows['N'], rows['CI_Low'], rows['CI_High'], color=color, alpha=0.2, linewidth=0)
+
+
+def _frame(tables, path):
+    return None if tables.get(path) is None else pd.DataFrame(tables[path])
+
+
+def _styles(*frames, methods=None):
+    """The METHOD_STYLES entries (of methods, default all) whose column every frame has."""
+    return [style for style in METHOD_STYLES
+            if (methods is None or style[0] in methods) and all(style[0] in df for df in frames)]
+
+
+def _save(output):
+    plt.savefig(output, dpi=300, bbox_inches='tight')
+    plt.close()
 
-    # Chart 1: Recursive vs DP timing (log scale)
+
+def recursive_vs_dp_timing(tables, output):
+    """Chart 1: Recursive vs DP timing (log scale)"""
+    timings_df = _frame(tables, PY_TIMINGS)
+    stats_df = _frame(tables, PY_STATS)
     plt.figure(figsize=(10, 6))
-    plt.plot(timings_df['N'], timings_df['Recursive'], label='Recursive', marker='o', color='red')
-    plt.plot(timings_df['N'], timings_df['DP'], label='Dynamic Programming', marker='s', color='blue')
+    for method, label, color, marker in _styles(timings_df, methods=('Recursive', 'DP')):
+        plt.plot(timings_df['N'], timings_df[method], label=label, marker=marker, color=color)
+        plot_error_band(stats_df, method.lower(), color)
     plt.yscale('log')
     plt.xlabel('n (Fibonacci index)')
     plt.ylabel('Time (seconds, log scale)')
     plt.title('Recursive vs Dynamic Programming: Time Complexity Comparison')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.savefig('recursive_vs_dp_timing.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(output)
+
 
-    # Chart 2: All three algorithms timing (linear scale)
+def all_algorithms_timing_linear(tables, output):
+    """Chart 2: All three algorithms timing (linear scale)"""
+    timings_df = _frame(tables, PY_TIMINGS)
+    stats_df = _frame(tables, PY_STATS)
     plt.figure(figsize=(10, 6))
-    plt.plot(timings_df['N'], timings_df['Iterative'], label='Iterative', marker='^', color='green')
-    plt.plot(timings_df['N'], timings_df['Recursive'], label='Recursive', marker='o', color='red')
-    plt.plot(timings_df['N'], timings_df['DP'], label='Dynamic Programming', marker='s', color='blue')
+    for method, label, color, marker in _styles(timings_df):
+        plt.plot(timings_df['N'], timings_df[method], label=label, marker=marker, color=color)
+        plot_error_band(stats_df, method.lower(), color)
     plt.xlabel('n (Fibonacci index)')
     plt.ylabel('Time (seconds)')
     plt.title('All Algorithms: Time Comparison (Linear Scale)')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.savefig('all_algorithms_timing_linear.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(output)
+
 
-    # Chart 3: Operations count comparison
+def operations_count_comparison(tables, output):
+    """Chart 3: Operations count comparison"""
+    ops_df = _frame(tables, PY_OPS)
     plt.figure(figsize=(10, 6))
-    plt.plot(ops_df['N'], ops_df['Iterative'], label='Iterative', marker='^', color='green')
-    plt.plot(ops_df['N'], ops_df['Recursive'], label='Recursive', marker='o', color='red')
-    plt.plot(ops_df['N'], ops_df['DP'], label='Dynamic Programming', marker='s', color='blue')
+    for method, label, color, marker in _styles(ops_df):
+        plt.plot(ops_df['N'], ops_df[method], label=label, marker=marker, color=color)
     plt.xlabel('n (Fibonacci index)')
     plt.ylabel('Operations Count')
     plt.title('Operations Count Comparison')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.savefig('operations_count_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(output)
 
-    # Chart 4: Big O theoretical vs empirical (log-log plot)
-    plt.figure(figsize=(10, 6))
 
-    # Theoretical curves
+def plot_growth(timings_df, plot=plt.plot):
+    """
+    Plots each method's measured times with the curve complexity_analysis
+    fits to them, labelled with the measured growth rate.
+    """
     n_vals = np.array(timings_df['N'])
-    plt.loglog(n_vals, n_vals, label='O(n) - Linear', linestyle='--', color='green', alpha=0.7)
-    plt.loglog(n_vals, 2**n_vals, label='O(2^n) - Exponential', linestyle='--', color='red', alpha=0.7)
+    for method, _, color, marker in _styles(timings_df):
+        result = complexity_analysis.classify_growth(list(zip(n_vals, timings_df[method])), perf_model.MIN_FIT_SECONDS)
+        plot(n_vals, timings_df[method].where(timings_df[method] > 0), label=f'{method} (empirical)',
+             marker=marker, color=color, linestyle='none')
+        if result['class'] is None:
+            continue
+        if result['class'] == 'exponential':
+            rate = f"{result['exp_base']:.3f}^n"
+        else:
+            rate = f"n^{result['loglog_slope']:.2f}"
+        plot(n_vals, complexity_analysis.growth_curve(result, n_vals), linestyle='--', color=color, alpha=0.7,
+             label=f"{method} fit: {rate} ({result['class']}, expected {complexity_analysis.EXPECTED[method]})")
 
-    # Empirical data (scaled for visualization)
-    scale_factor = 1e6  # Scale to make visible on log-log plot
-    plt.loglog(timings_df['N'], timings_df['Iterative'] * scale_factor + 1, label='Iterative (empirical)', marker='^', color='green')
-    plt.loglog(timings_df['N'], timings_df['Recursive'] * scale_factor + 1, label='Recursive (empirical)', marker='o', color='red')
-    plt.loglog(timings_df['N'], timings_df['DP'] * scale_factor + 1, label='DP (empirical)', marker='s', color='blue')
 
+def big_o_theoretical_vs_empirical(tables, output):
+    """Chart 4: Big O theoretical vs empirical (log-log plot)"""
+    timings_df = _frame(tables, PY_TIMINGS)
+    plt.figure(figsize=(10, 6))
+    plot_growth(timings_df, plt.loglog)
     plt.xlabel('n (log scale)')
-    plt.ylabel('Time/Operations (log scale)')
+    plt.ylabel('Time (seconds, log scale)')
     plt.title('Theoretical Big O vs Empirical Performance')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.savefig('big_o_theoretical_vs_empirical.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(output)
+
+
+def c_vs_python_comparison(tables, output):
+    """C vs Python bars at a few n (C: measured, or predicted by c_timing_simulator.py)"""
+    python_df = _frame(tables, PY_TIMINGS)
+    c_df = _frame(tables, C_PREDICTED)
+
+    plt.figure(figsize=(12, 8))
+
+    # Plot comparison for n=20, 30, 35, where both languages have a row
+    n_compare = [n for n in [20, 30, 35] if (python_df['N'] == n).any() and (c_df['N'] == n).any()]
+    methods = [method for method, _, _, _ in _styles(python_df, c_df)]
+    if not n_compare or not methods:
+        raise ValueError("no n or method is present in both the Python and the C timings")
+    x = np.arange(len(methods))
+    width = 0.35
+
+    for i, n in enumerate(n_compare):
+        plt.subplot(1, len(n_compare), i+1)
+
+        py_times = python_df[python_df['N'] == n][methods].iloc[0]
+        c_times = c_df[c_df['N'] == n][methods].iloc[0]
+
+        plt.bar(x - width/2, py_times, width, label='Python', alpha=0.8, color='blue')
+        plt.bar(x + width/2, c_times, width, label='C (measured/fitted)', alpha=0.8, color='orange')
+
+        plt.xlabel('Algorithm')
+        plt.ylabel('Time (seconds)')
+        plt.title(f'n = {n}')
+        plt.xticks(x, methods, rotation=45)
+        plt.legend()
+        plt.yscale('log')
+
+    plt.tight_layout()
+    _save(output)
+
+
+def c_vs_python_actual_comparison(tables, output):
+    """C vs Python timings, operations and speedup from the collected C data"""
+    c_timings_clean = _frame(tables, C_TIMINGS)
+    c_ops = _frame(tables, C_OPS)
+    py_timings_clean = _frame(tables, PY_TIMINGS)
+    py_ops = _frame(tables, PY_OPS)
+    c_stats = _frame(tables, C_STATS)
+    py_stats = _frame(tables, PY_STATS)
+
+    # Chart 1: C vs Python timing comparison
+    plt.figure(figsize=(12, 8))
+
+    # (column, color) in drawing order
+    lines = [('Iterative', 'b'), ('DP', 'g'), ('Recursive', 'r')]
+
+    plt.subplot(2, 2, 1)
+    for method, color in lines:
+        if method in c_timings_clean:
+            plt.plot(c_timings_clean['N'], c_timings_clean[method], f'{color}-', label=f'C {method}', linewidth=2)
+            plot_error_band(c_stats, method.lower(), color)
+        if method in py_timings_clean:
+            plt.plot(py_timings_clean['N'], py_timings_clean[method], f'{color}--', label=f'Python {method}', linewidth=2)
+            plot_error_band(py_stats, method.lower(), color)
+    plt.xlabel('N')
+    plt.ylabel('Time (seconds)')
+    plt.title('C vs Python: All Algorithms Timing Comparison')
+    plt.legend()
+    plt.yscale('log')
+
+    # Chart 2: Operations count comparison
+    plt.subplot(2, 2, 2)
+    for method, color in lines:
+        if method in c_ops:
+            plt.plot(c_ops['N'], c_ops[method], f'{color}-', label=f'C {method}', linewidth=2)
+        if method in py_ops:
+            plt.plot(py_ops['N'], py_ops[method], f'{color}--', label=f'Python {method}', linewidth=2)
+    plt.xlabel('N')
+    plt.ylabel('Operations Count')
+    plt.title('C vs Python: Operations Count Comparison')
+    plt.legend()
+
+    # Chart 3: C algorithms comparison
+    plt.subplot(2, 2, 3)
+    for method, color in lines:
+        if method in c_timings_clean:
+            plt.plot(c_timings_clean['N'], c_timings_clean[method], f'{color}-', label=method, linewidth=2)
+            plot_error_band(c_stats, method.lower(), color)
+    plt.xlabel('N')
+    plt.ylabel('Time (seconds)')
+    plt.title('C: Algorithm Performance Comparison')
+    plt.legend()
+    plt.yscale('log')
+
+    # Chart 4: Speedup ratios
+    plt.subplot(2, 2, 4)
+    # A C time of 0 is below the timer resolution: the ratio is undefined there, not infinite
+    c_nonzero = c_timings_clean.replace(0, np.nan)
+    for method, color in lines:
+        if method in c_timings_clean and method in py_timings_clean:
+            speedup = py_timings_clean[method] / c_nonzero[method]
+            plt.plot(c_timings_clean['N'], speedup, f'{color}-', label=f'{method} Speedup', linewidth=2)
+    plt.xlabel('N')
+    plt.ylabel('Python/C Time Ratio')
+    plt.title('C Speedup vs Python (Higher = C faster)')
+    plt.legend()
+    plt.yscale('log')
+
+    plt.tight_layout()
+    _save(output)
+
+
+def big_o_theoretical_vs_empirical_actual(tables, output):
+    """C: theoretical vs empirical complexity"""
+    c_timings_clean = _frame(tables, C_TIMINGS)
+    plt.figure(figsize=(10, 6))
+    plot_growth(c_timings_clean, plt.semilogy)
+    plt.xlabel('N')
+    plt.ylabel('Time (seconds, log scale)')
+    plt.title('C: Theoretical vs Empirical Complexity Analysis')
+    plt.legend()
+    _save(output)
+
+
+# output file -> (render function, input CSVs)
+CHARTS = {
+    'recursive_vs_dp_timing.png': (recursive_vs_dp_timing, [PY_TIMINGS, PY_STATS]),
+    'all_algorithms_timing_linear.png': (all_algorithms_timing_linear, [PY_TIMINGS, PY_STATS]),
+    'operations_count_comparison.png': (operations_count_comparison, [PY_OPS]),
+    'big_o_theoretical_vs_empirical.png': (big_o_theoretical_vs_empirical, [PY_TIMINGS]),
+    'c_vs_python_comparison.png': (c_vs_python_comparison, [PY_TIMINGS, C_PREDICTED]),
+    'c_vs_python_actual_comparison.png': (
+        c_vs_python_actual_comparison, [C_TIMINGS, C_OPS, PY_TIMINGS, PY_OPS, C_STATS, PY_STATS]
+    ),
+    'big_o_theoretical_vs_empirical_actual.png': (big_o_theoretical_vs_empirical_actual, [C_TIMINGS]),
+}
+
+
+def chart_key(output, hashes):
+    """Hash of everything a chart is drawn from: its inputs' contents and the code drawing it."""
+    digest = hashlib.sha256()
+    for path in CODE:
+        digest.update(hashes[path].encode())
+    for path in CHARTS[output][1]:
+        digest.update(f"{path}={hashes.get(path) or 'missing'}".encode())
+    return digest.hexdigest()
+
+
+def _render(job):
+    """
+    Pool worker: renders one chart from its parsed input columns.
+
+    Returns:
+        tuple: (output, None) once rendered, or (output, error message) if it
+        failed, so one broken chart does not abort the pool
+    """
+    output, tables = job
+    render, _ = CHARTS[output]
+    try:
+        render(tables, output)
+    except Exception as e:  # anything matplotlib or pandas raises on bad data
+        plt.close('all')
+        return output, f"{type(e).__name__}: {e}"
+    return output, None
+
+
+def _read_manifest(cache_dir):
+    path = os.path.join(cache_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(manifest, cache_dir):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def generate_charts(outputs=None, force=False, workers=None, cache_dir=CHART_CACHE_DIR):
+    """
+    Renders the stale charts among outputs (default: all of CHARTS).
+
+    Args:
+        outputs (list, optional): Chart file names to consider
+        force (bool): Render even charts that are up to date
+        workers (int, optional): Pool size (default: one per stale chart, at
+            most the number of available cores)
+        cache_dir (str): Where parsed CSVs and the manifest are kept
+
+    Returns:
+        list: The chart files that were rendered (failures are printed and
+        left stale, so the next run retries them)
+    """
+    outputs = list(CHARTS) if outputs is None else outputs
+    inputs = {path for output in outputs for path in CHARTS[output][1]}
+    hashes = {path: file_hash(path) for path in inputs | set(CODE) if os.path.exists(path)}
+    manifest = _read_manifest(cache_dir)
+
+    stale = []
+    for output in outputs:
+        missing = [path for path in CHARTS[output][1] if path not in hashes and path not in OPTIONAL_INPUTS]
+        if missing:
+            print(f"Skipping {output}: missing {', '.join(missing)}")
+        elif force or not os.path.exists(output) or manifest.get(output) != chart_key(output, hashes):
+            stale.append(output)
+    if not stale:
+        print("Charts are up to date.")
+        return []
+
+    # Each input is parsed (or loaded from the parse cache) once, here
+    tables, unreadable = {}, {}
+    for path in {p for o in stale for p in CHARTS[o][1]}:
+        try:
+            tables[path] = load_columns(path, cache_dir)
+        except (OSError, ValueError) as e:  # pandas parse errors are ValueErrors
+            unreadable[path] = e
+    jobs = []
+    for output in stale:
+        broken = [path for path in CHARTS[output][1] if path in unreadable]
+        if broken:
+            print(f"Skipping {output}: cannot read {', '.join(f'{p} ({unreadable[p]})' for p in broken)}")
+        else:
+            jobs.append((output, {path: tables[path] for path in CHARTS[output][1]}))
+    if not jobs:
+        return []
+    workers = workers or min(len(jobs), len(available_cores()))
+    rendered = []
+    with Pool(workers) as pool:
+        for output, error in pool.imap_unordered(_render, jobs):
+            if error is not None:
+                print(f"Failed to render {output}: {error}")
+                continue
+            manifest[output] = chart_key(output, hashes)
+            _write_manifest(manifest, cache_dir)
+            rendered.append(output)
+            print(f"Rendered {output}")
+    return rendered
 
-    print("Charts generated successfully!")
 
 if __name__ == "__main__":
-    generate_charts()
+    parser = argparse.ArgumentParser(description="Render the analysis charts that are out of date")
+    parser.add_argument("charts", nargs="*", help=f"charts to consider (default: all of {', '.join(CHARTS)})")
+    parser.add_argument("--force", action="store_true", help="render even charts that are up to date")
+    parser.add_argument("--workers", type=int, help="number of rendering processes")
+    args = parser.parse_args()
+    unknown = [chart for chart in args.charts if chart not in CHARTS]
+    if unknown:
+        parser.error(f"unknown charts: {', '.join(unknown)}")
+    generate_charts(args.charts or None, args.force, args.workers)
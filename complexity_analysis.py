@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Empirical complexity classification of the timing and operations data.
+
+Every (language, metric, method) series is fitted twice by least squares:
+log y = c + k log n gives the log-log slope k (the polynomial degree), and
+log y = c + n log b gives the exponential base b (phi ~ 1.618 for
+fib_recursive). The better of the two fits decides whether the series grows
+exponentially; otherwise the slope picks a polynomial class. Each class is
+compared with the one the algorithm is expected to have. A series that grows
+faster than expected is a regression; so is an operation count that grows
+slower, since counts are exact and that means the algorithm changed. Timings
+that grow slower are accepted: at small n they are dominated by constant
+overheads.
+
+The summary is written as JSON (complexity_summary.json).
+
+Sample execution:
+    python complexity_analysis.py            # write the summary
+    python complexity_analysis.py --check    # also exit 1 on regressions
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+
+from bench_cache import file_hash
+from perf_model import MIN_FIT_SECONDS, MIN_POINTS, PHI, least_squares, read_series
+
+METHODS = ["Iterative", "Recursive", "DP"]
+# (language, metric, CSV)
+SERIES = [
+    ("Python", "time", "timings_fib_python.csv"),
+    ("Python", "ops", "ops_fib_python.csv"),
+    ("C", "time", "timings_fib_c_actual.csv"),
+    ("C", "ops", "ops_fib_c_actual.csv"),
+]
+EXPECTED = {"Iterative": "linear", "Recursive": "exponential", "DP": "linear"}
+# Growth classes from slowest to fastest; upper log-log slope bound of each polynomial class
+CLASSES = ["constant", "logarithmic", "linear", "quadratic", "polynomial", "exponential"]
+SLOPE_BOUNDS = [("constant", 0.15), ("logarithmic", 0.6), ("linear", 1.5), ("quadratic", 2.5)]
+# An exponential fit must beat the power law and have at least this base
+MIN_EXPONENTIAL_BASE = 1.1
+# Relative tolerance on the base of an expected exponential (phi for fib_recursive)
+BASE_TOLERANCE = 0.1
+EXPECTED_BASE = {"Recursive": PHI}
+
+
+def classify_growth(points, floor=0.0):
+    """
+    Fits log-log slope and exponential base to (n, y) points and classifies them.
+
+    Args:
+        points (list): (n, y) pairs
+        floor (float): Values at or below this are ignored (e.g. the timer resolution)
+
+    Returns:
+        dict: points; loglog_slope, loglog_coef and loglog_r2 of
+        y = coef * n^slope; exp_base, exp_coef and exp_r2 of y = coef * base^n;
+        and class. Only points and class None when fewer than MIN_POINTS
+        usable points (with distinct n) remain
+    """
+    usable = sorted((n, y) for n, y in points if n > 0 and y > floor)
+    if len({n for n, _ in usable}) < MIN_POINTS:
+        return {"points": len(usable), "class": None}
+    logs = [math.log(y) for _, y in usable]
+    loglog = least_squares([math.log(n) for n, _ in usable], logs)
+    exp = least_squares([n for n, _ in usable], logs)
+    base = math.exp(exp.slope)
+    if exp.rmse < loglog.rmse and base >= MIN_EXPONENTIAL_BASE:
+        growth = "exponential"
+    else:
+        growth = next((name for name, bound in SLOPE_BOUNDS if loglog.slope < bound), "polynomial")
+    return {
+        "points": len(usable),
+        "loglog_slope": loglog.slope,
+        "loglog_coef": math.exp(loglog.intercept),
+        "loglog_r2": loglog.r2,
+        "exp_base": base,
+        "exp_coef": math.exp(exp.intercept),
+        "exp_r2": exp.r2,
+        "class": growth,
+    }
+
+
+def growth_curve(result, n):
+    """The fitted curve of a classify_growth() result at n, in the form of its class."""
+    if result["class"] == "exponential":
+        return result["exp_coef"] * result["exp_base"] ** n
+    return result["loglog_coef"] * n ** result["loglog_slope"]
+
+
+def check_expected(method, result, metric="time"):
+    """
+    Compares a classify_growth() result with the method's expected class.
+
+    Args:
+        method (str): One of METHODS
+        result (dict): classify_growth() result
+        metric (str): "time" or "ops"; slower growth than expected is only a
+            regression for operation counts
+
+    Returns:
+        str: "ok"; "regression" if it grows faster than expected (or, for an
+        expected exponential, with a base more than BASE_TOLERANCE above the
+        expected one), or if an operation count grows slower; "below_expected"
+        if a timing grows slower, which is accepted on purpose since small-n
+        times are dominated by constant overheads; or "insufficient_data"
+    """
+    if result["class"] is None:
+        return "insufficient_data"
+    expected = CLASSES.index(EXPECTED[method])
+    measured = CLASSES.index(result["class"])
+    if measured > expected:
+        return "regression"
+    if measured < expected:
+        return "regression" if metric == "ops" else "below_expected"
+    if method in EXPECTED_BASE and result["exp_base"] > EXPECTED_BASE[method] * (1 + BASE_TOLERANCE):
+        return "regression"
+    return "ok"
+
+
+def analyze(series=SERIES):
+    """
+    Classifies every method of every available series.
+
+    Returns:
+        dict: inputs (path -> sha256), series (one entry per language, metric
+        and method) and regressions (the entries flagged as such)
+    """
+    summary = {"inputs": {}, "series": [], "regressions": []}
+    for language, metric, path in series:
+        if not os.path.exists(path):
+            continue
+        summary["inputs"][path] = file_hash(path)
+        for method, points in read_series(path, METHODS).items():
+            result = classify_growth(points, MIN_FIT_SECONDS if metric == "time" else 0.0)
+            entry = {"language": language, "metric": metric, "method": method, **result,
+                     "expected": EXPECTED[method], "status": check_expected(method, result, metric)}
+            summary["series"].append(entry)
+            if entry["status"] == "regression":
+                summary["regressions"].append(entry)
+    return summary
+
+
+def write_summary(summary, out_file="complexity_summary.json"):
+    with open(out_file, "w") as f:
+        json.dump(summary, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Classify the empirical growth of each Fibonacci method")
+    parser.add_argument("--output", default="complexity_summary.json", help="where to write the JSON summary")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if any regression is found")
+    args = parser.parse_args()
+    summary = analyze()
+    write_summary(summary, args.output)
+    for entry in summary["series"]:
+        fitted = (f"slope={entry['loglog_slope']:.3f} base={entry['exp_base']:.4f}"
+                  if entry["class"] else "too few points")
+        print(f"{entry['language']:6} {entry['metric']:4} {entry['method']:9} {fitted:30} "
+              f"{entry['class'] or '-':11} expected {entry['expected']:11} {entry['status']}")
+    if args.check and summary["regressions"]:
+        sys.exit(1)
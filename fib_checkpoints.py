@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk store of Fibonacci checkpoints shared across processes.
+
+test_runner.py launches fibonacci.py once per (method, n), so every process
+starts cold. A CheckpointStore keeps (F(k), F(k+1)) pairs on disk so a later
+process can resume from the nearest k below n instead of from 0.
+
+Layout of the store directory:
+    index.bin   memory-mapped, sorted fixed-size records (k, offset, a_len, b_len, stamp)
+    values.bin  append-only little-endian bytes of F(k) followed by F(k+1)
+    lock        flock()ed shared for reads, exclusive for writes and eviction
+
+When values.bin grows past max_bytes, the least recently used checkpoints
+are evicted and the value file is compacted down to half the cap.
+"""
+
+import mmap
+import os
+import struct
+import time
+
+try:
+    import fcntl
+except ImportError:  # no flock on Windows; the store is then single-process only
+    fcntl = None
+
+MAGIC = b"FIBCKPT1"
+HEADER = struct.Struct("<8sQ")  # magic, record count
+RECORD = struct.Struct("<QQQQQ")  # k, offset, a_len, b_len, stamp
+
+DEFAULT_INTERVAL = 10000
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+class _Lock:
+    """Context manager around flock() on the store's lock file."""
+
+    def __init__(self, path, exclusive):
+        self.path = path
+        self.exclusive = exclusive
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+
+
+def _to_bytes(x):
+    return x.to_bytes((x.bit_length() + 7) // 8, "little")
+
+
+class CheckpointStore:
+    """
+    Directory-backed store of (F(k), F(k+1)) pairs.
+
+    Args:
+        directory (str): Where the index, value and lock files live (created if missing)
+        interval (int): Spacing of the regular checkpoints written by fib_iterative
+        max_bytes (int): Size cap of the value file before LRU eviction
+    """
+
+    def __init__(self, directory, interval=DEFAULT_INTERVAL, max_bytes=DEFAULT_MAX_BYTES):
+        if interval < 1:
+            raise ValueError("interval must be positive")
+        self.directory = directory
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.bin")
+        self.values_path = os.path.join(directory, "values.bin")
+        self.lock_path = os.path.join(directory, "lock")
+        os.makedirs(directory, exist_ok=True)
+        with _Lock(self.lock_path, exclusive=True):
+            if not os.path.exists(self.index_path):
+                self._write_index([])
+            if not os.path.exists(self.values_path):
+                open(self.values_path, "wb").close()
+
+    # -- index helpers (callers hold the lock) --------------------------------
+
+    def _read_index(self):
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+        magic, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.index_path} is not a checkpoint index")
+        return [list(RECORD.unpack_from(data, HEADER.size + i * RECORD.size)) for i in range(count)]
+
+    def _write_index(self, records):
+        tmp = self.index_path + f".{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(records)))
+            for rec in records:
+                f.write(RECORD.pack(*rec))
+        os.replace(tmp, self.index_path)
+
+    def _find(self, mm, n):
+        """Binary-searches the mapped index for the last record with k <= n."""
+        count = HEADER.unpack_from(mm, 0)[1]
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if RECORD.unpack_from(mm, HEADER.size + mid * RECORD.size)[0] <= n:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    # -- public API -----------------------------------------------------------
+
+    def nearest(self, n):
+        """
+        Returns (k, F(k), F(k+1)) for the largest stored k <= n, or None.
+        Marks the checkpoint as recently used.
+        """
+        with _Lock(self.lock_path, exclusive=False):
+            with open(self.index_path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+                i = self._find(mm, n)
+                if i < 0:
+                    return None
+                pos = HEADER.size + i * RECORD.size
+                k, offset, a_len, b_len, _ = RECORD.unpack_from(mm, pos)
+                # stamps are advisory; a lost update under a shared lock only
+                # makes LRU eviction slightly less exact
+                struct.pack_into("<Q", mm, pos + 32, time.time_ns())
+            with open(self.values_path, "rb") as vf:
+                vf.seek(offset)
+                raw = vf.read(a_len + b_len)
+        a = int.from_bytes(raw[:a_len], "little")
+        b = int.from_bytes(raw[a_len:], "little")
+        return k, a, b
+
+    def put(self, k, a, b):
+        """Stores the pair (F(k), F(k+1)) unless k is already present."""
+        a_raw, b_raw = _to_bytes(a), _to_bytes(b)
+        if len(a_raw) + len(b_raw) > self.max_bytes:
+            return
+        with _Lock(self.lock_path, exclusive=True):
+            records = self._read_index()
+            keys = [rec[0] for rec in records]
+            if k in keys:
+                return
+            with open(self.values_path, "ab") as vf:
+                offset = vf.tell()
+                vf.write(a_raw)
+                vf.write(b_raw)
+            records.append([k, offset, len(a_raw), len(b_raw), time.time_ns()])
+            records.sort(key=lambda rec: rec[0])
+            if offset + len(a_raw) + len(b_raw) > self.max_bytes:
+                records = self._evict(records)
+            self._write_index(records)
+
+    def _evict(self, records):
+        """Drops least recently used records and compacts the value file to max_bytes / 2."""
+        target = self.max_bytes // 2
+        kept, total = [], 0
+        for rec in sorted(records, key=lambda rec: rec[4], reverse=True):
+            size = rec[2] + rec[3]
+            if total + size <= target:
+                kept.append(rec)
+                total += size
+        kept.sort(key=lambda rec: rec[0])
+        tmp = self.values_path + f".{os.getpid()}.tmp"
+        with open(self.values_path, "rb") as src, open(tmp, "wb") as dst:
+            for rec in kept:
+                src.seek(rec[1])
+                data = src.read(rec[2] + rec[3])
+                rec[1] = dst.tell()
+                dst.write(data)
+        os.replace(tmp, self.values_path)
+        return kept
+
+    def keys(self):
+        """Returns the stored k values in ascending order."""
+        with _Lock(self.lock_path, exclusive=False):
+            return [rec[0] for rec in self._read_index()]
+
+    def size_bytes(self):
+        """Returns the current size of the value file."""
+        return os.path.getsize(self.values_path)
+
+    def clear(self):
+        """Removes every checkpoint."""
+        with _Lock(self.lock_path, exclusive=True):
+            self._write_index([])
+            open(self.values_path, "wb").close()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Native build of fibonacci.c and an in-process ctypes binding to it.
+
+The C compiler is taken from $CC, or else the first of cc, gcc and clang on
+PATH. fibonacci.c is built with optimization both as the command-line
+program (used by c_timing_collector.py) and as a shared library, whose
+fib_iterative / fib_recursive / fib_dp Python can call directly, with no
+process spawned per measurement. A second library built with -DFIB_COUNT_OPS
+counts the additions the same engines perform (count_ops). Builds are redone
+only when fibonacci.c is newer than the output.
+
+Sample execution:
+    python fib_native.py            # build both, print their paths
+    python -c "import fib_native; print(fib_native.fib_recursive(30))"
+    python -c "import fib_native; print(fib_native.count_ops('recursive', 20))"
+"""
+
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+
+SOURCE = "fibonacci.c"
+OPT_FLAGS = ["-O2"]
+COMPILERS = ["cc", "gcc", "clang"]
+
+if sys.platform == "win32":
+    EXE_NAME, LIB_NAME, OPS_LIB_NAME = "fibonacci.exe", "fibonacci.dll", "fibonacci_ops.dll"
+elif sys.platform == "darwin":
+    EXE_NAME, LIB_NAME, OPS_LIB_NAME = "fibonacci", "libfibonacci.dylib", "libfibonacci_ops.dylib"
+else:
+    EXE_NAME, LIB_NAME, OPS_LIB_NAME = "fibonacci", "libfibonacci.so", "libfibonacci_ops.so"
+
+_library = None
+_ops_library = None
+
+
+def find_compiler():
+    """
+    Returns the C compiler to use: $CC, or the first of COMPILERS on PATH.
+
+    Raises:
+        FileNotFoundError: If no compiler can be found
+    """
+    if os.environ.get("CC"):
+        return os.environ["CC"]
+    for name in COMPILERS:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise FileNotFoundError(f"no C compiler found (tried $CC and {', '.join(COMPILERS)})")
+
+
+def _build(output, extra_flags, source=SOURCE):
+    """Compiles source into output unless output is up to date; returns its absolute path."""
+    output = os.path.abspath(output)
+    if os.path.exists(output) and os.path.getmtime(output) >= os.path.getmtime(source):
+        return output
+    cmd = [find_compiler(), *OPT_FLAGS, *extra_flags, source, "-o", output]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{result.stderr}")
+    return output
+
+
+def build_executable(output=EXE_NAME, source=SOURCE):
+    """Builds the fibonacci command-line program; returns its absolute path."""
+    return _build(output, [], source)
+
+
+def build_library(output=LIB_NAME, source=SOURCE):
+    """Builds fibonacci.c as a position-independent shared library; returns its absolute path."""
+    return _build(output, ["-fPIC", "-shared"], source)
+
+
+def build_ops_library(output=OPS_LIB_NAME, source=SOURCE):
+    """Builds the operation-counting variant of the shared library; returns its absolute path."""
+    return _build(output, ["-fPIC", "-shared", "-DFIB_COUNT_OPS"], source)
+
+
+def _load(path):
+    lib = ctypes.CDLL(path)
+    for name in ("fib_iterative", "fib_recursive", "fib_dp_run"):
+        func = getattr(lib, name)
+        func.argtypes = [ctypes.c_int]
+        func.restype = ctypes.c_longlong
+    return lib
+
+
+def library():
+    """Builds (if needed) and loads the shared library once, with typed signatures."""
+    global _library
+    if _library is None:
+        _library = _load(build_library())
+    return _library
+
+
+def ops_library():
+    """Builds (if needed) and loads the operation-counting library once."""
+    global _ops_library
+    if _ops_library is None:
+        _ops_library = _load(build_ops_library())
+    return _ops_library
+
+
+def fib_iterative(n):
+    """fib_iterative(n) from fibonacci.c (64-bit, so exact up to n = 92)."""
+    return library().fib_iterative(n)
+
+
+def fib_recursive(n):
+    """fib_recursive(n) from fibonacci.c."""
+    return library().fib_recursive(n)
+
+
+def fib_dp(n):
+    """fib_dp(n) from fibonacci.c, with a fresh memo table per call."""
+    return library().fib_dp_run(n)
+
+
+# fibonacci.c method name -> binding, for the collectors
+ENGINES = {"iterative": fib_iterative, "recursive": fib_recursive, "dp": fib_dp}
+
+# fibonacci.c method name -> exported function
+_FUNCTIONS = {"iterative": "fib_iterative", "recursive": "fib_recursive", "dp": "fib_dp_run"}
+
+
+def count_ops(method, n):
+    """
+    Additions of Fibonacci values one call of a fibonacci.c engine performs,
+    counted by the engine itself (the same measure as fib_ops.count_ops()).
+
+    Args:
+        method (str): "iterative", "recursive" or "dp"
+        n (int): The index of the Fibonacci number to compute (n >= 0)
+
+    Returns:
+        int: The number of additions
+    """
+    lib = ops_library()
+    counter = ctypes.c_longlong.in_dll(lib, "fib_op_count")
+    counter.value = 0
+    getattr(lib, _FUNCTIONS[method])(n)
+    return counter.value
+
+
+if __name__ == "__main__":
+    print(build_executable())
+    print(build_library())
+    print(build_ops_library())
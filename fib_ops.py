@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Operation counting for the Fibonacci engines in fibonacci.py.
+
+Rather than hand-maintained `ops += 1` counters, this module builds a second,
+instrumented copy of fibonacci.py: its source is parsed, every Fibonacci-value
+`+` and `*` is rewritten into a counting call, and every function entry is
+counted as a call. The engines in fibonacci.py itself are never touched, so
+counting costs nothing when it is not used, and the counts always follow the
+code that is actually benchmarked.
+
+Index arithmetic is excluded: a `+` or `*` with an integer literal or an
+attribute (e.g. `n + 1`, `2 * self.window_size`) as an operand is not counted.
+Cache hits and misses come from the DP table's cache_info().
+"""
+
+import ast
+import inspect
+from collections import Counter
+
+import fibonacci
+
+# fibonacci.py method name -> engine name in the instrumented namespace
+ENGINES = {
+    "iterative": "fib_iterative",
+    "recursive": "fib_recursive",
+    "dp": "fib_dp",
+    "doubling": "fib_doubling",
+    "matrix": "fib_matrix",
+}
+
+_counts = Counter()
+_namespace = None
+
+
+def _ops_add(x, y):
+    _counts["additions"] += 1
+    return x + y
+
+
+def _ops_mul(x, y):
+    _counts["multiplications"] += 1
+    return x * y
+
+
+def _ops_call():
+    _counts["calls"] += 1
+
+
+class _Instrument(ast.NodeTransformer):
+    """Rewrites value additions/multiplications and function entries into counting calls."""
+
+    COUNTERS = {ast.Add: "_ops_add", ast.Mult: "_ops_mul"}
+
+    @staticmethod
+    def _is_index_operand(node):
+        return isinstance(node, ast.Attribute) or (
+            isinstance(node, ast.Constant) and isinstance(node.value, int)
+        )
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        counter = self.COUNTERS.get(type(node.op))
+        if counter is None or self._is_index_operand(node.left) or self._is_index_operand(node.right):
+            return node
+        call = ast.Call(ast.Name(counter, ast.Load()), [node.left, node.right], [])
+        return ast.copy_location(call, node)
+
+    def visit_FunctionDef(self, node):
+        self.generic_visit(node)
+        tick = ast.Expr(ast.Call(ast.Name("_ops_call", ast.Load()), [], []))
+        node.body.insert(0, ast.copy_location(tick, node.body[0]))
+        return node
+
+
+def _instrumented():
+    """Builds (once) the instrumented copy of fibonacci.py and returns its namespace."""
+    global _namespace
+    if _namespace is None:
+        tree = _Instrument().visit(ast.parse(inspect.getsource(fibonacci)))
+        ast.fix_missing_locations(tree)
+        namespace = {
+            "__name__": "fibonacci_counted",
+            "_ops_add": _ops_add,
+            "_ops_mul": _ops_mul,
+            "_ops_call": _ops_call,
+        }
+        exec(compile(tree, fibonacci.__file__, "exec"), namespace)
+        _namespace = namespace
+    return _namespace
+
+
+def count_ops(method, n):
+    """
+    Runs one cold evaluation of F(n) with the given method and counts its work.
+
+    Args:
+        method (str): One of the keys of ENGINES
+        n (int): The index of the Fibonacci number to compute (n >= 0)
+
+    Returns:
+        Counter: additions, multiplications, calls, cache_hits and cache_misses
+    """
+    namespace = _instrumented()
+    engine = namespace[ENGINES[method]]
+    namespace["fib_dp"].reset()
+    _counts.clear()
+    engine(n)
+    counts = Counter(dict.fromkeys(["additions", "multiplications", "calls", "cache_hits", "cache_misses"], 0))
+    counts.update(_counts)
+    if method == "dp":
+        info = namespace["fib_dp"].cache_info()
+        counts["cache_hits"] = info.hits
+        counts["cache_misses"] = info.misses
+    return counts
+
+
+def count_stream_ops(start, stop):
+    """
+    Counts the work of fib_stream(start, stop), i.e. of the print_series_*
+    modes: seeding the first pair by fast doubling, then one addition per term.
+
+    Returns:
+        Counter: additions and multiplications
+    """
+    namespace = _instrumented()
+    _counts.clear()
+    for _ in namespace["fib_stream"](start, stop):
+        pass
+    counts = Counter(dict.fromkeys(["additions", "multiplications"], 0))
+    counts.update({key: _counts[key] for key in counts})
+    return counts
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Output layer for large Fibonacci results.
+
+Once F(n) has millions of digits, converting it to decimal costs more than
+computing it: str(int) is quadratic before Python 3.12 and is limited by the
+int-max-str-digits guard. This module converts with a divide-and-conquer
+split on the binary representation, evaluated in the decimal module, whose
+large multiplications are subquadratic. It also offers hex/binary/raw modes
+(linear time), and streams decimal digits to a file in bounded pieces.
+
+Sample execution:
+    python fib_output.py doubling 1000000 --format dec --out f1m.txt
+    python fib_output.py doubling 10000 100000 1000000 --csv timings_fib_output.csv
+"""
+
+import argparse
+import csv
+import decimal
+import sys
+
+import fibonacci
+from benchmark_harness import measure, measure_method
+from fib_ops import ENGINES
+
+FORMATS = ["dec", "hex", "bin", "raw"]
+
+# Below these sizes the builtin conversions are faster than splitting further
+SMALL_BITS = 2048
+STREAM_CHUNK_DIGITS = 4096
+
+_CTX = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+_CTX.traps[decimal.Inexact] = True
+
+
+def _to_decimal(x):
+    """Converts a non-negative int to an exact decimal.Decimal by splitting on bits."""
+    pow2 = {}
+
+    def power_of_two(w):
+        if w not in pow2:
+            pow2[w] = _CTX.power(_CTX.create_decimal(2), w)
+        return pow2[w]
+
+    def convert(x, width):
+        if width <= SMALL_BITS:
+            return _CTX.create_decimal(x)
+        half = width >> 1
+        lo = convert(x & ((1 << half) - 1), half)
+        hi = convert(x >> half, width - half)
+        return _CTX.add(lo, _CTX.multiply(hi, power_of_two(half)))
+
+    return convert(x, x.bit_length())
+
+
+def to_decimal_string(x):
+    """
+    Converts an int to its decimal string in subquadratic time.
+
+    Time Complexity: O(M(d) log d) for d digits, M = decimal-module multiplication
+    Space Complexity: O(d)
+    """
+    if x < 0:
+        return "-" + to_decimal_string(-x)
+    if x.bit_length() <= SMALL_BITS:
+        return str(x)
+    return str(_to_decimal(x))
+
+
+def format_value(x, fmt="dec"):
+    """
+    Formats a non-negative int as decimal, hex or binary text, or raw
+    little-endian bytes.
+
+    Returns:
+        str or bytes: bytes for "raw", str otherwise
+    """
+    if fmt == "dec":
+        return to_decimal_string(x)
+    if fmt == "hex":
+        return format(x, "x")
+    if fmt == "bin":
+        return format(x, "b")
+    if fmt == "raw":
+        return x.to_bytes((x.bit_length() + 7) // 8, "little")
+    raise ValueError(f"unknown format {fmt!r}, expected one of {FORMATS}")
+
+
+def _write_decimal(d, out, width):
+    """
+    Writes a decimal integer d to out, zero-padded to width digits (0 means no
+    padding), by splitting on powers of ten until pieces are small enough to
+    str() directly. No piece larger than STREAM_CHUNK_DIGITS is materialized
+    as a string.
+    """
+    digits = max(d.adjusted() + 1 if d else 1, width)
+    if digits <= STREAM_CHUNK_DIGITS:
+        text = str(d)
+        out.write(text.zfill(width) if width else text)
+        return
+    k = digits // 2
+    hi, lo = _CTX.divmod(d, _CTX.scaleb(_CTX.create_decimal(1), k))
+    _write_decimal(hi, out, width - k if width else 0)
+    _write_decimal(lo, out, k)
+
+
+def write_value(x, out, fmt="dec"):
+    """
+    Writes x to an open file in the given format: out must be binary for
+    "raw" and text otherwise. Decimal output is streamed in pieces.
+    """
+    if fmt == "dec" and x.bit_length() > SMALL_BITS:
+        _write_decimal(_to_decimal(x), out, 0)
+    else:
+        out.write(format_value(x, fmt))
+
+
+def time_output(method, n, fmt="dec"):
+    """
+    Times computing F(n) and formatting it separately.
+
+    Returns:
+        tuple: (compute_seconds, format_seconds) medians from the benchmark harness
+    """
+    compute = measure_method(method, n)["median_ns"] / 1e9
+    value = getattr(fibonacci, ENGINES[method])(n)
+    formatting = measure(lambda _: format_value(value, fmt), n)["median_ns"] / 1e9
+    return compute, formatting
+
+
+def run_sweep(method, n_values, fmt, out_file):
+    """Writes compute and formatting times per n to out_file."""
+    with open(out_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["N", "Method", "Format", "Compute", "Formatting"])
+        for n in n_values:
+            compute, formatting = time_output(method, n, fmt)
+            writer.writerow([n, method, fmt, f"{compute:.9f}", f"{formatting:.9f}"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute and write large Fibonacci numbers")
+    parser.add_argument("method", choices=list(ENGINES))
+    parser.add_argument("n", type=int, nargs="+", help="the Fibonacci index (several with --csv)")
+    parser.add_argument("--format", choices=FORMATS, default="dec", help="the output format")
+    parser.add_argument("--out", type=str, default=None, help="write the value here instead of stdout")
+    parser.add_argument("--csv", type=str, default=None, help="time compute vs formatting for each n into this CSV")
+    args = parser.parse_args()
+
+    if args.csv:
+        run_sweep(args.method, args.n, args.format, args.csv)
+    else:
+        value = getattr(fibonacci, ENGINES[args.method])(args.n[0])
+        if args.out is None:
+            out = sys.stdout.buffer if args.format == "raw" else sys.stdout
+            write_value(value, out, args.format)
+            if args.format != "raw":
+                out.write("\n")
+        else:
+            with open(args.out, "wb" if args.format == "raw" else "w") as out:
+                write_value(value, out, args.format)
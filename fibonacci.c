@@ -1,8 +1,19 @@
+#define _POSIX_C_SOURCE 200809L
 #include <stdio.h>
 #include <stdlib.h>
 #include <time.h>
 #include <string.h>
 
+// Built with -DFIB_COUNT_OPS (fib_native.build_ops_library), the engines count
+// every addition of Fibonacci values in fib_op_count; otherwise COUNT_OP()
+// compiles to nothing and the timed engines are unchanged
+#ifdef FIB_COUNT_OPS
+long long fib_op_count = 0;
+#define COUNT_OP() (fib_op_count++)
+#else
+#define COUNT_OP() ((void)0)
+#endif
+
 /**
  * Computes the nth Fibonacci number using an iterative approach.
  * Time Complexity: O(n)
@@ -14,6 +25,7 @@ long long fib_iterative(int n) {
     if (n <= 1) return n;
     long long a = 0, b = 1, c;
     for (int i = 2; i <= n; i++) {
+        COUNT_OP();
         c = a + b;
         a = b;
         b = c;
@@ -30,6 +42,7 @@ long long fib_iterative(int n) {
  */
 long long fib_recursive(int n) {
     if (n <= 1) return n;
+    COUNT_OP();
     return fib_recursive(n - 1) + fib_recursive(n - 2);
 }
 
@@ -44,9 +57,26 @@ long long *memo;
 long long fib_dp(int n) {
     if (memo[n] != -1) return memo[n];
     if (n <= 1) return memo[n] = n;
+    COUNT_OP();
     return memo[n] = fib_dp(n - 1) + fib_dp(n - 2);
 }
 
+/**
+ * Computes the nth Fibonacci number with fib_dp on a freshly allocated memo
+ * table, so callers (e.g. the ctypes binding) need not manage memo.
+ * @param n The index of the Fibonacci number to compute (n >= 0)
+ * @return The nth Fibonacci number, or -1 if n < 0 or allocation fails
+ */
+long long fib_dp_run(int n) {
+    if (n < 0) return -1;
+    memo = (long long *)malloc((n + 1) * sizeof(long long));
+    if (memo == NULL) return -1;
+    for (int i = 0; i <= n; i++) memo[i] = -1;
+    long long result = fib_dp(n);
+    free(memo);
+    return result;
+}
+
 // Print series iteratively with operations count
 void print_series_iterative(int n, long long *ops) {
     *ops = 0;
@@ -83,17 +113,170 @@ void print_series_dp(int n, long long *ops) {
     free(memo);
 }
 
-// Timing function
+// Results are stored here so the optimizer cannot drop a timed call
+volatile long long fib_sink;
+
+// Monotonic wall-clock time in seconds
+double now_seconds(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+// Monotonic wall-clock time in nanoseconds
+long long now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+
+// Compiler barrier: the optimizer must assume x is read and changed here, so
+// a call can be neither dropped nor hoisted out of a repetition loop
+#if defined(__GNUC__) || defined(__clang__)
+#define BARRIER(x) __asm__ __volatile__("" : "+r"(x) : : "memory")
+#else
+#define BARRIER(x) (fib_sink = (x))
+#endif
+
+// Timing function: one call, monotonic clock
 double time_function(long long (*func)(int), int n) {
-    clock_t start = clock();
-    func(n);
-    clock_t end = clock();
-    return (double)(end - start) / CLOCKS_PER_SEC;
+    double start = now_seconds();
+    fib_sink = func(n);
+    double end = now_seconds();
+    return end - start;
+}
+
+/**
+ * Times one cold call of a method with the monotonic clock.
+ * @param method "iterative", "recursive" or "dp"
+ * @param n The index of the Fibonacci number to compute (n >= 0)
+ * @return Elapsed seconds, or -1 for an unknown method or negative n
+ */
+double time_method(const char *method, int n) {
+    double start, end;
+    if (n < 0) return -1;
+    if (strcmp(method, "iterative") == 0) {
+        start = now_seconds();
+        fib_sink = fib_iterative(n);
+        end = now_seconds();
+    } else if (strcmp(method, "recursive") == 0) {
+        start = now_seconds();
+        fib_sink = fib_recursive(n);
+        end = now_seconds();
+    } else if (strcmp(method, "dp") == 0) {
+        start = now_seconds();
+        fib_sink = fib_dp_run(n);
+        end = now_seconds();
+    } else {
+        return -1;
+    }
+    return end - start;
+}
+
+// Minimum duration of one bench sample; shorter calls are repeated to fill it
+#define BENCH_MIN_SAMPLE_NS 1000000LL
+#define BENCH_DEFAULT_SAMPLES 15
+
+// Runs func(n) `calls` times back to back; returns the elapsed nanoseconds
+static long long run_calls(long long (*func)(int), int n, long long calls) {
+    long long start = now_ns();
+    for (long long i = 0; i < calls; i++) {
+        int k = n;
+        BARRIER(k);
+        long long result = func(k);
+        BARRIER(result);
+    }
+    return now_ns() - start;
+}
+
+/**
+ * Benchmark mode: after a warm-up call, finds how many back-to-back calls
+ * take at least BENCH_MIN_SAMPLE_NS, then takes `samples` samples of that
+ * many calls. Prints one line for c_timing_collector.py to parse:
+ *   method=<m> n=<n> calls_per_sample=<c> samples=<k> ns_per_call=<v1>,...,<vk>
+ * @return 0, or 1 for an unknown method
+ */
+int run_bench(const char *method, int n, int samples) {
+    long long (*func)(int);
+    if (strcmp(method, "iterative") == 0) func = fib_iterative;
+    else if (strcmp(method, "recursive") == 0) func = fib_recursive;
+    else if (strcmp(method, "dp") == 0) func = fib_dp_run;
+    else return 1;
+
+    run_calls(func, n, 1);
+    long long calls = 1;
+    while (run_calls(func, n, calls) < BENCH_MIN_SAMPLE_NS) calls *= 2;
+
+    printf("method=%s n=%d calls_per_sample=%lld samples=%d ns_per_call=", method, n, calls, samples);
+    for (int i = 0; i < samples; i++) {
+        printf(i ? ",%.3f" : "%.3f", (double)run_calls(func, n, calls) / calls);
+    }
+    printf("\n");
+    return 0;
+}
+
+// Returns the text after "key": in a flat JSON object, or NULL if absent
+static const char *json_value(const char *line, const char *key) {
+    char quoted[64];
+    snprintf(quoted, sizeof quoted, "\"%s\"", key);
+    const char *p = strstr(line, quoted);
+    if (p == NULL) return NULL;
+    p = strchr(p + strlen(quoted), ':');
+    if (p == NULL) return NULL;
+    p++;
+    while (*p == ' ' || *p == '\t') p++;
+    return p;
+}
+
+/**
+ * Long-lived benchmark worker: reads newline-delimited JSON requests
+ * {"method": "dp", "n": 30, "repeats": 5} on stdin and answers each with one
+ * line {"method": ..., "n": ..., "seconds": [...]}, one timing per repeat,
+ * or {"error": ...}. Runs until EOF.
+ */
+int run_worker(void) {
+    char line[1024];
+    while (fgets(line, sizeof line, stdin) != NULL) {
+        if (strspn(line, " \t\r\n") == strlen(line)) continue;
+        char method[32];
+        const char *m = json_value(line, "method");
+        const char *nv = json_value(line, "n");
+        const char *rv = json_value(line, "repeats");
+        int n = nv != NULL ? atoi(nv) : -1;
+        int repeats = rv != NULL ? atoi(rv) : 1;
+        if (repeats < 1) repeats = 1;
+        if (m == NULL || *m != '"' || sscanf(m + 1, "%31[^\"]", method) != 1
+                || nv == NULL || time_method(method, 0) < 0 || n < 0) {
+            printf("{\"error\": \"bad request\"}\n");
+            fflush(stdout);
+            continue;
+        }
+        printf("{\"method\": \"%s\", \"n\": %d, \"seconds\": [", method, n);
+        for (int i = 0; i < repeats; i++) {
+            printf(i ? ", %.9f" : "%.9f", time_method(method, n));
+        }
+        printf("]}\n");
+        fflush(stdout);
+    }
+    return 0;
 }
 
 int main(int argc, char *argv[]) {
+    if (argc == 2 && strcmp(argv[1], "worker") == 0) {
+        return run_worker();
+    }
+    if (argc >= 4 && strcmp(argv[1], "bench") == 0) {
+        int samples = argc > 4 ? atoi(argv[4]) : BENCH_DEFAULT_SAMPLES;
+        if (run_bench(argv[2], atoi(argv[3]), samples > 0 ? samples : 1) != 0) {
+            printf("Invalid method\n");
+            return 1;
+        }
+        return 0;
+    }
     if (argc < 3) {
         printf("Usage: %s <method> <n>\n", argv[0]);
+        printf("       %s bench <method> <n> [samples]\n", argv[0]);
+        printf("       %s worker  (NDJSON requests on stdin)\n", argv[0]);
         return 1;
     }
     char *method = argv[1];
@@ -101,15 +284,15 @@ int main(int argc, char *argv[]) {
 
     if (strcmp(method, "iterative") == 0) {
         double time = time_function(fib_iterative, n);
-        printf("%.6f\n", time);
+        printf("%.9f\n", time);
     } else if (strcmp(method, "recursive") == 0) {
         double time = time_function(fib_recursive, n);
-        printf("%.6f\n", time);
+        printf("%.9f\n", time);
     } else if (strcmp(method, "dp") == 0) {
         memo = (long long *)malloc((n + 1) * sizeof(long long));
         for (int i = 0; i <= n; i++) memo[i] = -1;
         double time = time_function(fib_dp, n);
-        printf("%.6f\n", time);
+        printf("%.9f\n", time);
         free(memo);
     } else if (strcmp(method, "print_iter") == 0) {
         long long ops = 0;
@@ -7,31 +7,33 @@ import os
 import subprocess
 import sys
 
+import fib_native
+from fib_native import build_executable, build_library
+
 def verify_c_compilation():
     """Verify C code compiles and runs correctly."""
-    gcc_path = r"C:\Users\joshc\Downloads\gcc-15.2.0-gdb-16.3.90.20250511-binutils-2.45-mingw-w64-v13.0.0-ucrt\bin\gcc.exe"
-
-    if not os.path.exists(gcc_path):
-        print("❌ GCC not found")
-        return False
-
     try:
-        # Compile
-        result = subprocess.run([gcc_path, "fibonacci.c", "-o", "fibonacci.exe"],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Compilation failed: {result.stderr}")
-            return False
+        # Compile with the system compiler (see fib_native.py)
+        exe_path = build_executable()
+        build_library()
 
         # Test basic functionality
-        result = subprocess.run(["fibonacci.exe", "iterative", "10"],
+        result = subprocess.run([exe_path, "iterative", "10"],
                               capture_output=True, text=True)
-        if result.returncode != 0 or "0.000000" not in result.stdout:
+        if result.returncode != 0:
             print(f"❌ C test failed: {result.stderr}")
             return False
+        float(result.stdout.strip())
+
+        if fib_native.fib_iterative(10) != 55:
+            print("❌ C ctypes binding returned a wrong value")
+            return False
 
         print("✅ C compilation and basic test passed")
         return True
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return False
     except Exception as e:
         print(f"❌ C verification error: {e}")
         return False
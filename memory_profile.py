@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Peak memory per algorithm and n, to check the space complexity claims.
+
+Python engines are profiled in-process with tracemalloc: the peak traced
+allocation during one cold call, and the bytes and blocks still allocated
+afterwards (e.g. the DP table, which outlives the call). Whole programs (the
+Python CLI and the C binary) are profiled as child processes by their peak
+resident set size from the child's rusage (see bench_process.child_max_rss);
+Floor_KB is what a do-nothing program reports the same way, so peaks at that
+level are below the resolution of the measurement.
+
+Sample execution:
+    python memory_profile.py                  # both CSVs
+    python memory_profile.py --methods dp iterative --n 1000 100000
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tracemalloc
+
+import fibonacci
+from bench_process import child_max_rss, rss_floor_kb
+from benchmark_harness import reset_caches
+from fib_ops import ENGINES
+
+MEMORY_N_VALUES = [10, 100, 1000, 10000, 100000]
+# fib_recursive is exponential in time; larger n are not profiled
+RECURSIVE_MAX_N = 25
+CHILD_TIMEOUT = 60
+PYTHON_MEMORY_HEADER = ["N", "Method", "PeakBytes", "RetainedBytes", "RetainedBlocks", "MaxRSS_KB", "Floor_KB"]
+C_MEMORY_HEADER = ["N", "Method", "MaxRSS_KB", "Floor_KB"]
+
+
+def _profiled(method, n):
+    return method != "recursive" or n <= RECURSIVE_MAX_N
+
+
+def python_memory(method, n):
+    """
+    Traces one cold call of a fibonacci.py engine with tracemalloc.
+
+    Returns:
+        dict: peak_bytes allocated during the call, and retained_bytes and
+        retained_blocks still allocated after it (the result included)
+    """
+    engine = getattr(fibonacci, ENGINES[method])
+    checkpoints = fibonacci._checkpoints
+    fibonacci.use_checkpoints(None)
+    reset_caches()
+    tracemalloc.start()
+    try:
+        result = engine(n)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        fibonacci.use_checkpoints(checkpoints)
+    stats = snapshot.statistics("filename")
+    del result
+    return {
+        "peak_bytes": peak,
+        "retained_bytes": sum(stat.size for stat in stats),
+        "retained_blocks": sum(stat.count for stat in stats),
+    }
+
+
+def _rss_cell(cmd, env=None):
+    rss = child_max_rss(cmd, CHILD_TIMEOUT, env)
+    return "" if rss is None else rss
+
+
+def collect_python_memory(methods, n_values=MEMORY_N_VALUES, out_file="memory_fib_python.csv"):
+    """Writes tracemalloc figures and the CLI's peak RSS per (n, method)."""
+    env = dict(os.environ, FIB_BENCH_BUDGET="0")
+    floor = rss_floor_kb()
+    with open(out_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(PYTHON_MEMORY_HEADER)
+        for n in n_values:
+            for method in methods:
+                if not _profiled(method, n):
+                    continue
+                traced = python_memory(method, n)
+                rss = _rss_cell([sys.executable, "fibonacci.py", method, str(n)], env)
+                writer.writerow([n, method, traced["peak_bytes"], traced["retained_bytes"],
+                                 traced["retained_blocks"], rss, floor])
+
+
+def collect_c_memory(exe_path, methods, n_values=MEMORY_N_VALUES, out_file="memory_fib_c.csv"):
+    """Writes the C program's peak RSS per (n, method)."""
+    floor = rss_floor_kb()
+    with open(out_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(C_MEMORY_HEADER)
+        for n in n_values:
+            for method in methods:
+                if _profiled(method, n):
+                    writer.writerow([n, method, _rss_cell([exe_path, method, str(n)]), floor])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile peak memory of the Fibonacci engines")
+    parser.add_argument("--methods", nargs="+", choices=list(ENGINES), default=["iterative", "recursive", "dp"])
+    parser.add_argument("--n", type=int, nargs="+", default=MEMORY_N_VALUES, help="the n values to profile")
+    parser.add_argument("--no-c", action="store_true", help="skip building and profiling the C program")
+    args = parser.parse_args()
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+    collect_python_memory(args.methods, args.n)
+    if not args.no_c:
+        from fib_native import build_executable
+        c_methods = [m for m in args.methods if m in ("iterative", "recursive", "dp")]
+        collect_c_memory(build_executable(), c_methods, args.n)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Runtime models fitted from benchmark points.
+
+Used by the collectors to predict how long the next, larger n will take
+from the points measured so far, so runs that would blow the time budget
+are skipped (recorded as PREDICTED) instead of waiting for a timeout.
+
+fit_forms() fits a whole (language, method) series to the candidate
+complexity forms a*n + b, a*phi^n and a*log(n) by least squares, reports how
+well each fits, and predicts unmeasured n with a prediction interval.
+
+Sample execution:
+    python perf_model.py timings_fib_python.csv Recursive
+"""
+
+import csv
+import math
+import sys
+from collections import namedtuple
+
+# Only the most recent points describe the local growth rate well
+RECENT_POINTS = 6
+MIN_POINTS = 3
+# Times below this are dominated by timer resolution and are not fitted
+MIN_FIT_SECONDS = 1e-6
+
+Line = namedtuple("Line", ["slope", "intercept", "r2", "rmse", "mean_x", "sxx"])
+
+
+def least_squares(xs, ys):
+    """
+    Least-squares fit of y = intercept + slope * x.
+
+    Returns:
+        Line: slope, intercept, r2, rmse, and the mean and sum of squared
+        deviations of x (for prediction intervals); None if x does not vary
+    """
+    k = len(xs)
+    mean_x = sum(xs) / k
+    mean_y = sum(ys) / k
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    intercept = mean_y - slope * mean_x
+    ss_res = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    r2 = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return Line(slope, intercept, r2, math.sqrt(ss_res / k), mean_x, sxx)
+
+
+def fit_log_linear(points):
+    """
+    Least-squares fit of log(t) = c + d*n, i.e. t = e^c * (e^d)^n.
+
+    Args:
+        points (list): (n, seconds) pairs
+
+    Returns:
+        tuple: (c, d), or None when fewer than MIN_POINTS usable points exist
+    """
+    usable = [(n, math.log(t)) for n, t in points if t >= MIN_FIT_SECONDS]
+    usable = sorted(usable)[-RECENT_POINTS:]
+    if len(usable) < MIN_POINTS:
+        return None
+    line = least_squares([n for n, _ in usable], [y for _, y in usable])
+    return None if line is None else (line.intercept, line.slope)
+
+
+def predict_runtime(points, n):
+    """
+    Predicts the runtime at n from earlier (n, seconds) points.
+
+    Returns:
+        float: predicted seconds, or None if there is not enough data
+    """
+    fit = fit_log_linear(points)
+    if fit is None:
+        return None
+    c, d = fit
+    # growth can only be trusted upward; a flat or noisy fit must not predict a speed-up
+    return math.exp(c + max(d, 0.0) * n)
+
+
+def numeric_points(cells):
+    """Turns {n: cell} CSV cells into (n, seconds) points, dropping TIMEOUT/PREDICTED/ERROR."""
+    points = []
+    for n, cell in cells.items():
+        try:
+            points.append((n, float(cell)))
+        except (TypeError, ValueError):
+            continue
+    return points
+
+
+def read_series(path, methods):
+    """Reads a wide CSV (an N column, one column per method) into {method: [(n, value), ...]}."""
+    cells = {method: {} for method in methods}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            for method in methods:
+                cells[method][int(row["N"])] = row.get(method, "")
+    return {method: numeric_points(cells[method]) for method in methods}
+
+
+PHI = (1 + math.sqrt(5)) / 2
+# Two-sided ~95% normal quantile for prediction intervals
+PREDICTION_Z = 1.96
+FORMS = ["linear", "exponential", "logarithmic"]
+
+Prediction = namedtuple("Prediction", ["estimate", "low", "high"])
+
+
+class Fit:
+    """
+    One candidate form fitted to (n, seconds) points.
+
+    Attributes:
+        form (str): "linear" (a*n + b), "exponential" (a*phi^n) or "logarithmic" (a*log n)
+        params (dict): The fitted coefficients, a and (linear only) b
+        r2 (float): Coefficient of determination on the seconds themselves
+        log_rmse (float): RMS of log(predicted / measured); comparable across
+            forms and series, inf if the form predicts a non-positive time
+        points (int): Number of points fitted
+    """
+
+    def __init__(self, form, params, points, stderr, leverage):
+        self.form = form
+        self.params = params
+        self.points = len(points)
+        self._stderr = stderr
+        self._leverage = leverage
+        ts = [t for _, t in points]
+        predicted = [self._curve(n) for n, _ in points]
+        mean_t = sum(ts) / len(ts)
+        ss_tot = sum((t - mean_t) ** 2 for t in ts)
+        ss_res = sum((t - p) ** 2 for t, p in zip(ts, predicted))
+        self.r2 = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+        if all(p > 0 for p in predicted):
+            self.log_rmse = math.sqrt(sum(math.log(p / t) ** 2 for t, p in zip(ts, predicted)) / len(ts))
+        else:
+            self.log_rmse = math.inf
+
+    def _curve(self, n):
+        a = self.params["a"]
+        if self.form == "linear":
+            return a * n + self.params["b"]
+        if self.form == "exponential":
+            try:
+                return a * PHI ** n
+            except OverflowError:
+                return math.inf
+        return a * math.log(n)
+
+    def predict(self, n):
+        """
+        Predicts the runtime at n with a PREDICTION_Z prediction interval.
+
+        The exponential form is fitted in log space, so its interval is
+        multiplicative; the others are additive (and clipped at 0).
+
+        Returns:
+            Prediction: estimate, low, high (seconds)
+        """
+        estimate = self._curve(n)
+        spread = PREDICTION_Z * self._stderr * math.sqrt(1 + self._leverage(n))
+        if self.form == "exponential":
+            return Prediction(estimate, estimate / math.exp(spread), estimate * math.exp(spread))
+        return Prediction(estimate, max(estimate - spread, 0.0), estimate + spread)
+
+    def __repr__(self):
+        params = ", ".join(f"{k}={v:.4g}" for k, v in self.params.items())
+        return f"Fit({self.form}: {params}, r2={self.r2:.4f}, log_rmse={self.log_rmse:.4f})"
+
+
+def _residual_stderr(residuals, n_params):
+    dof = len(residuals) - n_params
+    return math.sqrt(sum(r * r for r in residuals) / dof) if dof > 0 else 0.0
+
+
+def _fit_linear(points):
+    k = len(points)
+    line = least_squares([n for n, _ in points], [t for _, t in points])
+    if line is None:
+        return None
+    a, b = line.slope, line.intercept
+    stderr = _residual_stderr([t - (a * n + b) for n, t in points], 2)
+    return Fit("linear", {"a": a, "b": b}, points, stderr,
+               lambda n: 1 / k + (n - line.mean_x) ** 2 / line.sxx)
+
+
+def _fit_exponential(points):
+    # log t = log a + n log(phi): only log a is free, so it is the mean offset
+    k = len(points)
+    offsets = [math.log(t) - n * math.log(PHI) for n, t in points]
+    log_a = sum(offsets) / k
+    stderr = _residual_stderr([o - log_a for o in offsets], 1)
+    return Fit("exponential", {"a": math.exp(log_a)}, points, stderr, lambda n: 1 / k)
+
+
+def _fit_logarithmic(points):
+    # t = a log n through the origin; n = 1 carries no information (log 1 = 0)
+    sxx = sum(math.log(n) ** 2 for n, _ in points)
+    if sxx == 0:
+        return None
+    a = sum(t * math.log(n) for n, t in points) / sxx
+    stderr = _residual_stderr([t - a * math.log(n) for n, t in points], 1)
+    return Fit("logarithmic", {"a": a}, points, stderr, lambda n: math.log(n) ** 2 / sxx)
+
+
+def fit_forms(points):
+    """
+    Least-squares fits of every candidate form to a series.
+
+    Points with non-positive n or times (below the timer resolution) are
+    ignored.
+
+    Args:
+        points (list): (n, seconds) pairs
+
+    Returns:
+        dict: form -> Fit, for the forms that could be fitted (empty when
+        fewer than MIN_POINTS usable points exist)
+    """
+    usable = sorted((n, t) for n, t in points if n > 0 and t > 0)
+    if len(usable) < MIN_POINTS:
+        return {}
+    fits = {}
+    for form, fitter in [("linear", _fit_linear), ("exponential", _fit_exponential),
+                         ("logarithmic", _fit_logarithmic)]:
+        fit = fitter(usable)
+        if fit is not None:
+            fits[form] = fit
+    return fits
+
+
+def best_fit(points):
+    """The Fit with the lowest log_rmse, or None if nothing could be fitted."""
+    fits = fit_forms(points)
+    return min(fits.values(), key=lambda fit: fit.log_rmse) if fits else None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python perf_model.py <timings.csv> <column>")
+        sys.exit(1)
+    with open(sys.argv[1]) as f:
+        cells = {int(row["N"]): row[sys.argv[2]] for row in csv.DictReader(f)}
+    series = numeric_points(cells)
+    for fit in sorted(fit_forms(series).values(), key=lambda fit: fit.log_rmse):
+        print(fit)
+    best = best_fit(series)
+    if best is not None:
+        for n in [max(cells) + 5, max(cells) + 10]:
+            print(f"n={n}: {best.predict(n)}")
@@ -5,44 +5,80 @@ Test script to verify C compilation and basic functionality.
 
 import subprocess
 import sys
-import os
 
-def test_c_compilation():
-    """Test if C code compiles and runs basic functionality."""
+import fib_native
+import fibonacci
+from bench_worker import Worker, WorkerError
+from c_timing_collector import parse_bench_output
+from fib_ops import count_ops
+from fib_native import build_executable, build_library
 
-    gcc_path = r"C:\Users\joshc\Downloads\gcc-15.2.0-gdb-16.3.90.20250511-binutils-2.45-mingw-w64-v13.0.0-ucrt\bin\gcc.exe"
+def check_c_compilation():
+    """
+    Checks that the C code compiles and runs basic functionality.
 
-    # Check if GCC exists
-    if not os.path.exists(gcc_path):
-        print("GCC not found at expected path")
-        return False
+    Returns:
+        bool: True if every check passed (the failing one is printed)
+    """
 
     try:
-        # Compile the C code
-        result = subprocess.run([gcc_path, "fibonacci.c", "-o", "fibonacci.exe"],
-                              capture_output=True, text=True, cwd=".")
-
-        if result.returncode != 0:
-            print(f"Compilation failed: {result.stderr}")
-            return False
+        # Build the program and the shared library with the system compiler
+        exe_path = build_executable()
+        build_library()
 
         print("C code compiled successfully")
 
         # Test basic functionality
-        result = subprocess.run(["fibonacci.exe", "iterative", "10"],
+        result = subprocess.run([exe_path, "iterative", "10"],
                               capture_output=True, text=True, cwd=".")
 
-        if result.returncode == 0:
-            print(f"C iterative test passed: {result.stdout.strip()}")
-            return True
-        else:
+        if result.returncode != 0:
             print(f"C test failed: {result.stderr}")
             return False
+        print(f"C iterative test passed: {result.stdout.strip()}")
 
-    except Exception as e:
+        # Test the ctypes binding against the Python engines
+        for name, engine in fib_native.ENGINES.items():
+            expected = [getattr(fibonacci, f"fib_{name}")(n) for n in range(25)]
+            if [engine(n) for n in range(25)] != expected:
+                print(f"C {name} binding returned wrong values")
+                return False
+        print("C ctypes binding test passed")
+
+        # Test that the C engines count the same additions as fib_ops counts in Python
+        for name in fib_native.ENGINES:
+            if [fib_native.count_ops(name, n) for n in range(1, 16)] != \
+                    [count_ops(name, n)["additions"] for n in range(1, 16)]:
+                print(f"C {name} operation count differs from fib_ops")
+                return False
+        print("C operation count test passed")
+
+        # Test the persistent worker mode
+        with Worker([exe_path, "worker"]) as worker:
+            if len(worker.measure("dp", 30, repeats=5)) != 5:
+                print("C worker returned the wrong number of samples")
+                return False
+        print("C worker test passed")
+
+        # Test the in-binary repetition mode and its parser
+        result = subprocess.run([exe_path, "bench", "iterative", "20", "4"],
+                              capture_output=True, text=True)
+        bench = parse_bench_output(result.stdout)
+        if (bench["method"], bench["n"], bench["samples"]) != ("iterative", 20, 4) \
+                or bench["calls_per_sample"] < 2 or min(bench["ns_per_call"]) <= 0:
+            print(f"C bench mode returned {result.stdout.strip()!r}")
+            return False
+        print("C bench mode test passed")
+        return True
+
+    except (FileNotFoundError, RuntimeError, OSError, ValueError, KeyError, WorkerError) as e:
         print(f"Error testing C compilation: {e}")
         return False
 
+def test_c_compilation():
+    """Test if C code compiles and runs basic functionality."""
+    assert check_c_compilation(), "C compilation checks failed (see output)"
+
 if __name__ == "__main__":
-    success = test_c_compilation()
+    success = check_c_compilation()
     sys.exit(0 if success else 1)
@@ -26,5 +26,616 @@ def test_fibonacci_correctness():
 
     print("All correctness tests passed!")
 
+def test_fib_doubling():
+    """Test that fast doubling agrees with the iterative method, including large n."""
+    from fibonacci import fib_iterative, fib_doubling
+
+    for n in list(range(0, 100)) + [1000, 4096, 10007]:
+        assert fib_doubling(n) == fib_iterative(n), f"Doubling failed for n={n}"
+
+    print("Fast doubling tests passed!")
+
+def test_fib_matrix():
+    """Test the matrix-power engine, with and without a modulus, and its batched form."""
+    from fibonacci import fib_iterative, fib_matrix, fib_matrix_many
+
+    for n in list(range(0, 60)) + [500, 1023]:
+        expected = fib_iterative(n)
+        assert fib_matrix(n) == expected, f"Matrix failed for n={n}"
+        assert fib_matrix(n, 1000003) == expected % 1000003, f"Matrix mod failed for n={n}"
+
+    ns = [0, 1, 2, 90, 7, 12345, 3, 10 ** 6]
+    for mod in (1, 10, 2 ** 31, 10 ** 12):
+        assert fib_matrix_many(ns, mod) == [fib_matrix(n, mod) for n in ns], f"Batch failed for mod={mod}"
+    huge = [3, 2 ** 63, 2 ** 70 + 1]
+    assert fib_matrix_many(huge, 97) == [fib_matrix(n, 97) for n in huge], "Batch failed for n >= 2**63"
+    for mod in (97, 10 ** 12):
+        try:
+            fib_matrix_many([5, -1], mod)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Negative n accepted for mod={mod}")
+
+    print("Matrix tests passed!")
+
+def test_fib_mod_pisano():
+    """Test Pisano periods against a brute-force walk and fib_mod for huge n."""
+    from fibonacci import pisano_period, fib_mod, fib_matrix
+
+    for m in range(1, 300):
+        a, b, period = 0, 1 % m, 0
+        while True:
+            a, b = b, (a + b) % m
+            period += 1
+            if (a, b) == (0, 1 % m):
+                break
+        assert pisano_period(m) == period, f"Pisano period failed for m={m}"
+
+    for m in (10, 1000, 10 ** 9 + 7, 2 ** 40):
+        for n in (0, 1, 10 ** 18, 10 ** 18 + 12345):
+            assert fib_mod(n, m) == fib_matrix(n, m), f"fib_mod failed for n={n}, m={m}"
+
+    hits = pisano_period.cache_info().hits
+    fib_mod(10 ** 18, 10 ** 9 + 7)
+    assert pisano_period.cache_info().hits == hits + 1, "Pisano period was not reused from cache"
+
+    print("Modular tests passed!")
+
+def test_fib_dp_bounded():
+    """Test that the DP table is recursion-free, stays within budget and resets."""
+    from fibonacci import fib_iterative, FibMemoTable
+
+    class ProbedTable(FibMemoTable):
+        # the window is largest just before it is trimmed
+        def _trim(self, keep):
+            peaks.append(self.stored())
+            super()._trim(keep)
+
+    for budget, stride in [(64, 16), (64, 4), (4, 1), (5, 2)]:
+        peaks = []
+        table = ProbedTable(budget=budget, stride=stride)
+        for n in [5000, 10, 4990, 2000, 5001, 0, 1, 33, 5000]:
+            assert table(n) == fib_iterative(n), f"Bounded DP failed for n={n}"
+            assert table.stored() <= table.budget, f"Budget exceeded after n={n}"
+        assert max(peaks) <= table.budget, f"Budget {budget} exceeded during a call: {max(peaks)}"
+
+    table.reset()
+    assert table.stored() == 2, "reset() did not clear the table"
+
+    print("Bounded DP tests passed!")
+
+def test_fib_many():
+    """Test that batched evaluation returns per-index results in the original order."""
+    from fibonacci import fib_iterative, fib_many
+
+    ns = [30, 0, 5, 30, 100000, 1, 2500, 2600, 7]
+    assert fib_many(ns) == [fib_iterative(n) for n in ns], "fib_many failed"
+    assert fib_many([]) == [], "fib_many failed for no queries"
+
+    print("Batched tests passed!")
+
+def test_fib_stream():
+    """Test the series generator and that print modes stream through it."""
+    import io
+    from fibonacci import fib_iterative, fib_stream, print_series_recursive
+
+    assert list(fib_stream(0, 50)) == [fib_iterative(n) for n in range(50)], "Stream failed from 0"
+    assert list(fib_stream(1000, 1010)) == [fib_iterative(n) for n in range(1000, 1010)], "Stream failed from 1000"
+
+    out = io.StringIO()
+    print_series_recursive(60, out)
+    lines = out.getvalue().splitlines()
+    assert lines[59] == f"60: {fib_iterative(60)}", "print_series_recursive output wrong"
+    # counted by fib_ops: 2 additions seeding fib_stream at F(1), then one per term
+    assert lines[-1] == "Operations: 62", "print_series_recursive ops wrong"
+
+    print("Stream tests passed!")
+
+def _put_checkpoints(args):
+    from fib_checkpoints import CheckpointStore
+    from fibonacci import _fib_pair
+
+    directory, ks = args
+    store = CheckpointStore(directory, interval=100)
+    for k in ks:
+        store.put(k, *_fib_pair(k))
+
+def test_checkpoint_store():
+    """Test resuming from on-disk checkpoints, concurrent writers and the size cap."""
+    import tempfile
+    import time
+    from multiprocessing import Pool
+    import fibonacci
+    from fib_checkpoints import CheckpointStore
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CheckpointStore(directory, interval=100)
+        fibonacci.use_checkpoints(store)
+        try:
+            for n in [250, 1234, 1299, 5000, 50]:
+                expected = fibonacci._fib_pair(n)[0]
+                assert fibonacci.fib_iterative(n) == expected, f"Checkpointed iterative failed for n={n}"
+                assert fibonacci.fib_doubling(n + 3) == fibonacci._fib_pair(n + 3)[0], f"Checkpointed doubling failed for n={n}"
+                assert fibonacci.fib_matrix(n + 7) == fibonacci._fib_pair(n + 7)[0], f"Checkpointed matrix failed for n={n}"
+        finally:
+            fibonacci.use_checkpoints(None)
+        assert 1200 in store.keys(), "fib_iterative did not record its checkpoint"
+        # fib_iterative fills the grid; fib_doubling(53) found nothing below and stored its own pair
+        assert [k for k in store.keys() if k % 100] == [53], f"Unexpected checkpoints stored: {store.keys()}"
+        k, a, b = store.nearest(1250)
+        assert k == 1200 and (a, b) == fibonacci._fib_pair(1200), "nearest() returned the wrong pair"
+
+    with tempfile.TemporaryDirectory() as directory:
+        with Pool(4) as pool:
+            pool.map(_put_checkpoints, [(directory, range(i, 400, 4)) for i in range(4)])
+        store = CheckpointStore(directory, interval=100)
+        assert store.keys() == list(range(400)), "Concurrent writers lost checkpoints"
+        for k in (0, 17, 399):
+            assert store.nearest(k)[1:] == fibonacci._fib_pair(k), f"Corrupt checkpoint k={k}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CheckpointStore(directory, interval=100, max_bytes=4096)
+        for k in range(0, 5000, 100):
+            store.put(k, *fibonacci._fib_pair(k))
+        assert store.size_bytes() <= 4096, "Checkpoint store exceeded its size cap"
+        assert 4900 in store.keys(), "Most recent checkpoint was evicted"
+
+    # the store must never slow fib_doubling down: one doubling on a miss, none on a repeat
+    n = 1005000
+    start = time.perf_counter()
+    fibonacci.fib_doubling(n)
+    plain = time.perf_counter() - start
+    pair, doublings = fibonacci._fib_pair, []
+    with tempfile.TemporaryDirectory() as directory:
+        fibonacci.use_checkpoints(CheckpointStore(directory))
+        fibonacci._fib_pair = lambda k: doublings.append(k) or pair(k)
+        try:
+            elapsed = []
+            for k in [n, n, n + 1]:
+                start = time.perf_counter()
+                result = fibonacci.fib_doubling(k)
+                elapsed.append(time.perf_counter() - start)
+                assert result == pair(k)[0], f"Checkpointed doubling failed for n={k}"
+        finally:
+            fibonacci._fib_pair = pair
+            fibonacci.use_checkpoints(None)
+    assert doublings == [n], f"Doublings with a checkpoint store: {doublings}"
+    assert max(elapsed[1:]) < plain, f"Repeated calls not faster with the store: {elapsed} vs {plain:.3f}s"
+
+    print("Checkpoint store tests passed!")
+
+def test_op_counts():
+    """Test that instrumented counts match the known work of each engine."""
+    from fib_ops import count_ops
+    from fibonacci import fib_iterative
+
+    for n in range(2, 21):
+        assert count_ops("iterative", n)["additions"] == n - 1, f"Iterative ops wrong for n={n}"
+        assert count_ops("dp", n)["additions"] == n - 1, f"DP ops wrong for n={n}"
+        recursive = count_ops("recursive", n)
+        assert recursive["additions"] == fib_iterative(n + 1) - 1, f"Recursive additions wrong for n={n}"
+        assert recursive["calls"] == 2 * fib_iterative(n + 1) - 1, f"Recursive calls wrong for n={n}"
+
+    dp = count_ops("dp", 50)
+    assert (dp["cache_hits"], dp["cache_misses"]) == (0, 1), "Cold DP should be a single miss"
+
+    print("Operation count tests passed!")
+
+def test_timing_statistics():
+    """Test outlier rejection, the bootstrap interval and the summary of raw samples."""
+    from benchmark_harness import bootstrap_ci, reject_outliers, summarize
+
+    samples = [100 + i % 7 for i in range(50)] + [10000]
+    assert reject_outliers(sorted(samples)) == sorted(samples)[:-1], "Outlier was kept"
+    low, high = bootstrap_ci(samples[:-1])
+    assert 100 <= low <= 103 <= high <= 106, f"Bad bootstrap interval: {(low, high)}"
+    assert bootstrap_ci(samples[:-1]) == (low, high), "Bootstrap is not reproducible"
+
+    summary = summarize(samples)
+    assert (summary["samples"], summary["kept"], summary["median"]) == (51, 50, 103), summary
+    assert summary["iqr"] == summary["q3"] - summary["q1"] and summary["p95"] < 10000, summary
+
+    print("Timing statistics tests passed!")
+
+def test_benchmark_harness():
+    """Test that the harness reports ordered, non-zero statistics and clears caches."""
+    import fibonacci
+    from benchmark_harness import measure_method
+
+    stats = measure_method("iterative", 30, budget_s=0.05)
+    assert stats["samples"] >= 1, "Harness took no samples"
+    assert 0 < stats["min_ns"] <= stats["median_ns"] <= stats["p95_ns"], f"Bad statistics: {stats}"
+    assert stats["q1_ns"] <= stats["median_ns"] <= stats["q3_ns"], f"Median outside IQR: {stats}"
+    assert stats["ci_low_ns"] <= stats["median_ns"] <= stats["ci_high_ns"], f"Median outside CI: {stats}"
+
+    measure_method("dp", 500, budget_s=0.05)
+    assert fibonacci.fib_dp.cache_info().misses == 1, "DP cache was not reset between samples"
+
+    # the CLI must time the same engine instances that the harness resets
+    import contextlib
+    import io
+    import runpy
+    import sys
+    argv = sys.argv
+    sys.argv = ["fibonacci.py", "dp", "1000"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(fibonacci.__file__, run_name="__main__")
+    finally:
+        sys.argv = argv
+    info = fibonacci.fib_dp.cache_info()
+    assert (info.hits, info.misses) == (0, 1), f"CLI timed a warm DP table: {info}"
+
+    print("Benchmark harness tests passed!")
+
+def test_fast_decimal_output():
+    """Test subquadratic decimal conversion and streamed output against str()."""
+    import io
+    import sys
+    from fib_output import to_decimal_string, write_value, format_value
+    from fibonacci import fib_doubling
+
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+    for x in [0, 7, fib_doubling(3001), fib_doubling(50000), 10 ** 20000 + 7]:
+        assert to_decimal_string(x) == str(x), "Decimal conversion failed"
+        out = io.StringIO()
+        write_value(x, out)
+        assert out.getvalue() == str(x), "Streamed decimal output failed"
+        assert int(format_value(x, "hex"), 16) == x, "Hex output failed"
+        assert int.from_bytes(format_value(x, "raw"), "little") == x, "Raw output failed"
+
+    print("Output tests passed!")
+
+def test_parallel_series():
+    """Test that the parallel series matches print_series_iterative byte for byte."""
+    import io
+    from fib_ops import count_stream_ops
+    from fibonacci import print_series_iterative, print_series_parallel
+
+    for n in [0, 1, 2, 3, 57, 1000]:
+        sequential, parallel = io.StringIO(), io.StringIO()
+        print_series_iterative(n, sequential)
+        print_series_parallel(n, parallel, workers=3, segment=17)
+        series, ops = parallel.getvalue().rsplit("Operations: ", 1)
+        assert series == sequential.getvalue().rsplit("Operations: ", 1)[0], f"Parallel series differs for n={n}"
+        # each 17-line segment is seeded by its own doubling
+        count = max(n, 2) if n >= 1 else 1
+        expected = sum(count_stream_ops(first - 1, min(first + 17, count + 1) - 1)["additions"]
+                       for first in range(1, count + 1, 17))
+        assert int(ops) == expected, f"Parallel ops {ops.strip()} for n={n}, expected {expected}"
+
+    print("Parallel series tests passed!")
+
+def test_recursive_stack_and_parallel():
+    """Test the explicit-stack and parallel-subtree recursive modes."""
+    from fibonacci import fib_iterative, fib_recursive_stack, fib_recursive_parallel, _walk_call_tree
+    from benchmark_harness import recursive_scaling
+
+    for n in range(0, 20):
+        assert fib_recursive_stack(n) == fib_iterative(n), f"Explicit-stack recursion failed for n={n}"
+        assert _walk_call_tree(n)[1] == 2 * fib_iterative(n + 1) - 1, f"Explicit-stack call count wrong for n={n}"
+    for n in (0, 1, 2, 15, 22):
+        assert fib_recursive_parallel(n, workers=2) == fib_iterative(n), f"Parallel recursion failed for n={n}"
+
+    rows = recursive_scaling(12, [1, 2])
+    assert [row[0] for row in rows] == [0, 1, 2], "Scaling report missing worker counts"
+    assert all(seconds > 0 and speedup > 0 for _, seconds, speedup in rows), f"Bad scaling rows: {rows}"
+
+    print("Recursive mode tests passed!")
+
+def test_runner_modes():
+    """Test that the in-process, worker and subprocess timers all produce numeric cells."""
+    import test_runner
+    from test_runner import time_inprocess, time_subprocess, time_worker
+
+    for timer in (time_inprocess, time_worker):
+        stats = timer("iterative", 25)
+        assert float(stats["Median"]) > 0 and stats["Kept"] <= stats["Samples"], f"{timer.__name__} returned {stats!r}"
+    cell = time_subprocess("iterative", 25)
+    assert float(cell) > 0, f"time_subprocess returned {cell!r}"
+
+    # the subprocess mode times one cold call per process, not the CLI's warm median
+    calls = []
+    run_command = test_runner.run_command
+    test_runner.run_command = lambda cmd, env=None: calls.append(env) or ("0.1", "", 0)
+    try:
+        time_subprocess("iterative", 25)
+    finally:
+        test_runner.run_command = run_command
+    assert calls[0]["FIB_BENCH_BUDGET"] == "0", "time_subprocess did not ask for a single cold call"
+
+    print("Runner mode tests passed!")
+
+def test_worker_protocol():
+    """Test the NDJSON worker mode of fibonacci.py, directly and through bench_worker."""
+    import io
+    import json
+    import subprocess
+    import sys
+    from bench_worker import Worker, WorkerError
+    from fibonacci import serve_worker
+
+    requests = io.StringIO('{"method": "dp", "n": 30, "repeats": 3}\n\n{"method": "nope", "n": 1}\n')
+    replies = io.StringIO()
+    serve_worker(requests, replies)
+    first, second = [json.loads(line) for line in replies.getvalue().splitlines()]
+    assert (first["method"], first["n"], len(first["seconds"])) == ("dp", 30, 3), first
+    assert all(t > 0 for t in first["seconds"]) and "error" in second, (first, second)
+
+    with Worker([sys.executable, "fibonacci.py", "worker"]) as worker:
+        assert len(worker.measure("iterative", 100, repeats=50)) == 50, "Worker lost repeats"
+        try:
+            worker.measure("nope", 1)
+            assert False, "Worker accepted an unknown method"
+        except WorkerError:
+            pass
+        try:
+            worker.measure("recursive", 60, timeout=0.2)
+            assert False, "Worker did not time out"
+        except subprocess.TimeoutExpired:
+            pass
+        assert len(worker.sample("dp", 50, 20, 0.5)) == 20, "Worker was not restarted after a timeout"
+
+    print("Worker protocol tests passed!")
+
+def test_startup_cost():
+    """Test that whole-invocation timing separates start-up from compute and honours timeouts."""
+    import os
+    import sys
+    from bench_process import run_measured, time_startup
+
+    env = dict(os.environ, FIB_BENCH_BUDGET="0")
+    summary = time_startup([sys.executable, "fibonacci.py", "iterative", "10"], runs=2, env=env)
+    wall, compute, startup = (float(summary[c]) for c in ("Wall", "Compute", "Startup"))
+    assert 0 < compute < startup and abs(wall - compute - startup) < 1e-5, summary
+    assert summary["Runs"] == 2 and summary["MaxRSS_KB"] > 0, summary
+
+    killed = run_measured([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.2)
+    assert killed["returncode"] is None and killed["wall"] < 5, killed
+
+    print("Start-up cost tests passed!")
+
+def test_memory_profile():
+    """Test that tracemalloc figures reflect the DP table and child RSS excludes the parent."""
+    import sys
+    from bench_process import child_max_rss, rss_floor_kb
+    from memory_profile import python_memory
+
+    iterative = python_memory("iterative", 10000)
+    dp = python_memory("dp", 10000)
+    assert dp["retained_bytes"] > 100 * iterative["retained_bytes"] > 0, (iterative, dp)
+    assert dp["peak_bytes"] >= dp["retained_bytes"] and dp["retained_blocks"] > 1000, dp
+
+    floor = rss_floor_kb()
+    if floor is not None:
+        ballast = bytearray(256 << 20)  # the parent's RSS must not show up in its children
+        for i in range(0, len(ballast), 4096):
+            ballast[i] = 1
+        assert floor < 64 << 10 and rss_floor_kb() < 64 << 10, floor
+        big = child_max_rss([sys.executable, "-c", "x = bytearray(128 << 20); x[::4096] = b'1' * len(x[::4096])"])
+        assert big > 128 << 10, big
+        del ballast
+
+    print("Memory profile tests passed!")
+
+def _square(job):
+    return job * job
+
+def _phi_timing(job):
+    # a stand-in timer: fib_recursive-like growth, 60 s (test_runner.TIMEOUT) at n ~ 37
+    _, method, n = job
+    return f"{1e-6 * 1.618 ** n if method == 'recursive' else 1e-6 * n:.9f}"
+
+def test_bench_scheduler():
+    """Test that scheduled results are complete, keyed by job and honour the skip hook."""
+    from bench_scheduler import run_jobs
+
+    jobs = list(range(20))
+    results = run_jobs(jobs, _square, workers=2, longest_first=True, cost=lambda job: job)
+    assert results == {job: job * job for job in jobs}, "Scheduler lost or mixed up results"
+
+    skipped = run_jobs(jobs, _square, workers=2, skip=lambda job, done: -1 if job % 2 else None)
+    assert all(skipped[job] == (-1 if job % 2 else job * job) for job in jobs), "Skip hook ignored"
+
+    held = []
+    run_jobs(jobs, _square, workers=3, longest_first=True, cost=lambda job: job,
+             ready=lambda job, done: all(k in done for k in range(job)),
+             skip=lambda job, done: held.append(all(k in done for k in range(job))))
+    assert held == [True] * len(jobs), "Ready hook did not hold jobs back"
+
+    print("Scheduler tests passed!")
+
+def test_predictive_cutoff():
+    """Test that the growth model recovers phi and the runner records PREDICTED cells."""
+    import math
+    from perf_model import fit_log_linear, predict_runtime
+    from bench_scheduler import run_jobs
+    from test_runner import TIMEOUT, _skip_predicted, _smaller_points_done, estimated_cost
+
+    phi = (1 + 5 ** 0.5) / 2
+    points = [(n, 1e-6 * phi ** n) for n in range(10, 20)]
+    c, d = fit_log_linear(points)
+    assert abs(math.exp(d) - phi) < 1e-9, f"Fitted base {math.exp(d)}, expected phi"
+    assert abs(predict_runtime(points, 40) - 1e-6 * phi ** 40) < 1e-6, "Prediction off the fitted curve"
+    assert predict_runtime(points[:2], 40) is None, "Predicted from too few points"
+
+    results = {("inprocess", "recursive", n): f"{t:.9f}" for n, t in points}
+    results[("inprocess", "recursive", 9)] = "0.000000"
+    cell = _skip_predicted(("inprocess", "recursive", 60), results)
+    assert cell.startswith("PREDICTED:") and float(cell.split(":")[1]) > TIMEOUT, cell
+    assert _skip_predicted(("inprocess", "recursive", 20), results) is None, "Skipped a cheap run"
+    results[("inprocess", "dp", 5)] = "TIMEOUT"
+    assert _skip_predicted(("inprocess", "dp", 6), results) == "TIMEOUT", "Ran past a timeout"
+
+    # longest-first must not start recursive n=40 before the points predicting it exist
+    jobs = [("inprocess", method, n) for n in range(1, 41) for method in ("recursive", "iterative")]
+    results = run_jobs(jobs, _phi_timing, workers=2, longest_first=True, cost=estimated_cost,
+                       skip=_skip_predicted, ready=lambda job, done: _smaller_points_done(job, done, jobs))
+    assert all(results[("inprocess", "recursive", n)].startswith("PREDICTED:") for n in (38, 39, 40)), \
+        "Longest-first ran exponential points past the time budget"
+    assert not results[("inprocess", "recursive", 37)].startswith("PREDICTED:"), "Skipped a run within budget"
+
+    print("Predictive cutoff tests passed!")
+
+def test_complexity_fits():
+    """Test that least-squares fits pick the generating form and bracket unmeasured n."""
+    import math
+    import random
+    from perf_model import PHI, best_fit, fit_forms
+
+    rng = random.Random(1)
+    series = {
+        "linear": [(n, (2e-7 * n + 1e-5) * rng.uniform(0.98, 1.02)) for n in range(100, 2000, 100)],
+        "exponential": [(n, 3e-8 * PHI ** n * rng.uniform(0.9, 1.1)) for n in range(10, 30)],
+        "logarithmic": [(n, 4e-6 * math.log(n) * rng.uniform(0.98, 1.02)) for n in range(2, 200000, 10000)],
+    }
+    for form, points in series.items():
+        fit = best_fit(points)
+        assert fit.form == form, f"{form} series fitted as {fit}"
+        assert fit.r2 > 0.9, f"Poor fit quality for {form}: {fit}"
+
+    fit = fit_forms(series["exponential"])["exponential"]
+    assert abs(fit.params["a"] / 3e-8 - 1) < 0.05, f"Fitted coefficient {fit.params['a']}"
+    prediction = fit.predict(40)
+    assert prediction.low < 3e-8 * PHI ** 40 < prediction.high, f"Interval misses the truth: {prediction}"
+    assert prediction.low < prediction.estimate < prediction.high
+    assert fit_forms(series["linear"][:2]) == {}, "Fitted from too few points"
+
+    print("Complexity fit tests passed!")
+
+def test_chart_pipeline():
+    """Test that charts are parsed once into columns and re-rendered only when stale."""
+    import math
+    import os
+    import shutil
+    import tempfile
+    import chart_generator
+
+    chart = 'operations_count_comparison.png'
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(chart_generator.PY_OPS, tmp)
+        os.chdir(tmp)
+        try:
+            with open('timings.csv', 'w') as f:
+                f.write("N,Recursive,Method\n1,0.5,dp\n2,TIMEOUT,dp\n3,PREDICTED:9.5,dp\n")
+            columns = chart_generator.load_columns('timings.csv', 'cache')
+            assert list(columns['Recursive'][:1]) == [0.5] and all(map(math.isnan, columns['Recursive'][1:])), columns
+            assert list(columns['Method']) == ['dp'] * 3, "Text column was parsed as numbers"
+            assert len(os.listdir('cache')) == 1 and chart_generator.load_columns('missing.csv', 'cache') is None
+
+            assert chart_generator.generate_charts([chart], workers=1, cache_dir='cache') == [chart]
+            assert os.path.exists(chart), "Chart was not rendered"
+            assert chart_generator.generate_charts([chart], workers=1, cache_dir='cache') == [], "Re-rendered a fresh chart"
+            with open(chart_generator.PY_OPS, 'a') as f:
+                f.write("21,20,2097151,21\n")
+            assert chart_generator.generate_charts([chart], workers=1, cache_dir='cache') == [chart], "Missed a changed input"
+            os.remove(chart)
+            assert chart_generator.generate_charts([chart], workers=1, cache_dir='cache') == [chart], "Missed a deleted chart"
+
+            # a missing method column is left out; a chart that fails does not stop the others
+            with open(chart_generator.PY_OPS, 'w') as f:
+                f.write("N,Iterative,DP\n1,0,1\n2,1,2\n")
+            with open(chart_generator.PY_TIMINGS, 'w') as f:
+                f.write("N,Iterative,DP\n1,1e-6,2e-6\n")
+            with open(chart_generator.C_PREDICTED, 'w') as f:
+                f.write("N,Iterative,DP\n1,1e-8,2e-8\n")
+            charts = [chart, 'c_vs_python_comparison.png']
+            assert chart_generator.generate_charts(charts, workers=1, cache_dir='cache') == [chart], "Failure aborted the pool"
+            assert 'c_vs_python_comparison.png' not in chart_generator._read_manifest('cache'), "Failed chart recorded"
+        finally:
+            os.chdir(cwd)
+
+    print("Chart pipeline tests passed!")
+
+def test_complexity_analysis():
+    """Test that growth classification recovers phi for fib_recursive and flags regressions."""
+    from complexity_analysis import check_expected, classify_growth
+    from fib_ops import count_ops
+    from perf_model import PHI
+
+    calls = [(n, count_ops("recursive", n)["calls"]) for n in range(5, 21)]
+    result = classify_growth(calls)
+    assert result["class"] == "exponential", result
+    assert abs(result["exp_base"] - PHI) < 0.01, f"Fitted base {result['exp_base']}, expected phi"
+    assert check_expected("Recursive", result) == "ok", result
+
+    linear = classify_growth([(n, 3e-6 * n) for n in range(100, 2000, 100)], 1e-6)
+    assert linear["class"] == "linear" and abs(linear["loglog_slope"] - 1) < 1e-9, linear
+    assert check_expected("DP", linear) == "ok"
+    quadratic = classify_growth([(n, 1e-9 * n * n) for n in range(100, 2000, 100)])
+    assert check_expected("DP", quadratic) == "regression", quadratic
+    doubling = classify_growth([(n, 1e-8 * 2 ** n) for n in range(10, 30)])
+    assert check_expected("Recursive", doubling) == "regression", "Base 2 passed as phi"
+    flat = classify_growth([(n, 0.0) for n in range(1, 40)], 1e-6)
+    assert check_expected("Iterative", flat) == "insufficient_data", flat
+    # slower than expected: accepted for timings, a regression for exact operation counts
+    assert check_expected("Recursive", linear) == "below_expected", linear
+    assert check_expected("Recursive", linear, "ops") == "regression", "Linear recursive count passed"
+
+    print("Complexity analysis tests passed!")
+
+def test_result_cache():
+    """Test that cached results persist, resume after truncation and follow the source hash."""
+    import json
+    import os
+    import tempfile
+    from bench_cache import ResultCache
+    from bench_scheduler import run_jobs
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "engine.py")
+        with open(source, "w") as f:
+            f.write("v1")
+        cache = ResultCache("python", [source], "3.x", directory=tmp)
+        run_jobs([1, 2, 3], _square, workers=2, on_result=lambda job, result: cache.put(result, "m", job))
+        with open(cache.path, "a") as f:
+            f.write('{"key": "interrupted')  # a write cut short by a killed sweep
+
+        reloaded = ResultCache("python", [source], "3.x", directory=tmp)
+        assert [reloaded.get("m", n) for n in (1, 2, 3, 4)] == [1, 4, 9, None], "Cache did not resume"
+        reloaded.put(16, "m", 4)
+        assert ResultCache("python", [source], "3.x", directory=tmp).get("m", 4) == 16, "Append after torn line lost"
+        assert ResultCache("python", [source], "3.y", directory=tmp).get("m", 2) is None, "Version ignored"
+        with open(source, "w") as f:
+            f.write("v2")
+        assert ResultCache("python", [source], "3.x", directory=tmp).get("m", 2) is None, "Source edit ignored"
+
+        # a timeout may be down to a busy host: it is retried, never cached
+        cache = ResultCache("python", [source], "3.x", directory=tmp)
+        cache.put("TIMEOUT", "m", 5)
+        cache.put("ERROR", "m", 6)
+        assert cache.get("m", 5) is None and cache.get("m", 6) is None, "Failure cached"
+        with open(cache.path, "a") as f:
+            f.write(json.dumps({"key": cache.key("m", 7), "point": ["m", 7], "result": "TIMEOUT"}) + "\n")
+        assert ResultCache("python", [source], "3.x", directory=tmp).get("m", 7) is None, "Old cached failure reused"
+
+    print("Result cache tests passed!")
+
 if __name__ == "__main__":
     test_fibonacci_correctness()
+    test_fib_doubling()
+    test_fib_matrix()
+    test_fib_mod_pisano()
+    test_fib_dp_bounded()
+    test_fib_many()
+    test_fib_stream()
+    test_checkpoint_store()
+    test_op_counts()
+    test_timing_statistics()
+    test_benchmark_harness()
+    test_fast_decimal_output()
+    test_parallel_series()
+    test_recursive_stack_and_parallel()
+    test_runner_modes()
+    test_worker_protocol()
+    test_startup_cost()
+    test_memory_profile()
+    test_bench_scheduler()
+    test_predictive_cutoff()
+    test_result_cache()
+    test_complexity_fits()
+    test_chart_pipeline()
+    test_complexity_analysis()
@@ -1,53 +1,263 @@
 import subprocess
 import csv
+import os
 import sys
+import argparse
 
-def run_command(cmd):
+from bench_cache import ResultCache, python_version
+from bench_process import STARTUP_HEADER, time_startup
+from bench_scheduler import run_jobs
+from bench_worker import Worker
+from benchmark_harness import DEFAULT_BUDGET_S, MAX_SAMPLES, STATS_HEADER, measure_method, stats_cells, summarize
+from fib_ops import count_ops
+from memory_profile import collect_python_memory
+from perf_model import numeric_points, predict_runtime
+
+# fibonacci.py method name -> CSV column header
+METHOD_COLUMNS = {
+    "iterative": "Iterative",
+    "recursive": "Recursive",
+    "dp": "DP",
+    "doubling": "Doubling",
+    "matrix": "Matrix",
+}
+DEFAULT_METHODS = ["iterative", "recursive", "dp", "doubling"]
+MODES = ["inprocess", "worker", "subprocess"]
+TIMEOUT = 60
+# n values and invocations per (method, n) for the start-up cost CSV
+STARTUP_N_VALUES = [1, 10, 20, 30]
+STARTUP_RUNS = 5
+
+# Methods whose cost grows exponentially with n. Their jobs are dispatched in
+# increasing-n order even with --longest-first, so that the growth model in
+# _skip_predicted sees every smaller point before a large n is started (an
+# in-process run cannot be interrupted)
+EXPONENTIAL_METHODS = {"recursive"}
+
+# The persistent `fibonacci.py worker` of this process, started on first use
+_worker = None
+
+def run_command(cmd, timeout=TIMEOUT, env=None):
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
         return result.stdout.strip(), result.stderr.strip(), result.returncode
     except subprocess.TimeoutExpired:
         return "TIMEOUT", "", -1
 
-def test_fibonacci():
+def time_subprocess(method, n):
+    """
+    Cold-start timing: one fresh `python fibonacci.py` per data point, timing
+    a single cold call (FIB_BENCH_BUDGET=0) rather than the CLI's default
+    warm-interpreter median.
+    """
+    env = dict(os.environ, FIB_BENCH_BUDGET="0")
+    stdout, stderr, code = run_command([sys.executable, "fibonacci.py", method, str(n)], env=env)
+    return stdout if code == 0 else "TIMEOUT"
+
+def time_inprocess(method, n):
+    """
+    Statistics from the in-process benchmark harness (warm interpreter, cold
+    caches), as a dict of benchmark_harness.STATS_COLUMNS cells in seconds.
+    """
+    return measure_method(method, n, cells=True)
+
+def time_worker(method, n):
+    """
+    Statistics from a persistent `python fibonacci.py worker` (one per
+    scheduler process), in the same form as time_inprocess(): a separate
+    interpreter, but started once rather than per data point.
+    """
+    global _worker
+    if _worker is None:
+        _worker = Worker([sys.executable, "fibonacci.py", "worker"])
+    try:
+        samples = _worker.sample(method, n, MAX_SAMPLES, DEFAULT_BUDGET_S, timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return "TIMEOUT"
+    return stats_cells(summarize(samples), suffix="", scale=1)
+
+def timing_cell(result):
+    """The single timings CSV cell of a job result: the median of in-process statistics."""
+    return result["Median"] if isinstance(result, dict) else result
+
+def _run_job(job):
+    """Scheduler entry point: job is (mode, method, n)."""
+    mode, method, n = job
+    timers = {"inprocess": time_inprocess, "worker": time_worker, "subprocess": time_subprocess}
+    return timers[mode](method, n)
+
+def estimated_cost(job):
+    """Rough relative cost of a job, used to dispatch the longest jobs first."""
+    mode, method, n = job
+    return 1.618 ** n if method == "recursive" else n
+
+def _skip_predicted(job, results):
+    """
+    Answers a job without running it when the method already timed out at a
+    smaller n, or when a growth model fitted to its finished points predicts
+    it would take longer than TIMEOUT; the latter is recorded as
+    PREDICTED:<seconds> so the estimate stays in the CSV.
+    """
+    mode, method, n = job
+    cells = {}
+    for (_, done_method, done_n), cell in results.items():
+        if done_method == method and done_n < n:
+            if cell == "TIMEOUT":
+                return "TIMEOUT"
+            cells[done_n] = timing_cell(cell)
+    predicted = predict_runtime(numeric_points(cells), n)
+    if predicted is not None and predicted > TIMEOUT:
+        return f"PREDICTED:{predicted:.6f}"
+    return None
+
+def _smaller_points_done(job, results, jobs):
+    """Scheduler ready hook: an exponential method's job waits for its smaller n."""
+    mode, method, n = job
+    if method not in EXPONENTIAL_METHODS:
+        return True
+    return all(done in results for done in jobs if done[:2] == (mode, method) and done[2] < n)
+
+def test_fibonacci(methods=None, mode="inprocess", workers=1, longest_first=False, use_cache=True,
+                   checkpoint_dir=None):
     # Skip C compilation since gcc not available, focus on Python
-    methods = ["iterative", "recursive", "dp"]
+    methods = methods or DEFAULT_METHODS
     n_values = list(range(1, 41))  # Up to 40 for timing
 
-    # Python timings
+    # Warm-checkpoint mode (subprocess only): every fibonacci.py process shares
+    # the on-disk CheckpointStore in checkpoint_dir, passed on through the
+    # environment the pool and its subprocesses inherit
+    if checkpoint_dir is not None:
+        if mode != "subprocess":
+            raise ValueError("checkpoint_dir needs mode='subprocess'")
+        os.environ["FIB_CHECKPOINT_DIR"] = checkpoint_dir
+    try:
+        _sweep(methods, mode, n_values, workers, longest_first, use_cache, checkpoint_dir is not None)
+    finally:
+        if checkpoint_dir is not None:
+            del os.environ["FIB_CHECKPOINT_DIR"]
+
+def _sweep(methods, mode, n_values, workers, longest_first, use_cache, warm):
+    # Points measured by an earlier run of the same sources, interpreter and
+    # host are reused; new results are cached as they finish, so an
+    # interrupted sweep picks up where it stopped. Warm-checkpoint results
+    # measure something else and are cached apart
+    sources = ["fibonacci.py", "benchmark_harness.py"] + (["fib_checkpoints.py"] if warm else [])
+    cache = ResultCache("python-warm" if warm else "python", sources, python_version()) if use_cache else None
+
+    def skip(job, results):
+        cached = cache.get(*job) if cache is not None else None
+        return cached if cached is not None else _skip_predicted(job, results)
+
+    def on_result(job, result):
+        if cache is not None:
+            cache.put(result, *job)
+
+    # Python timings, scheduled across pinned workers; runs predicted to exceed
+    # TIMEOUT from the smaller n already measured are not attempted, and a cell
+    # that still comes in over TIMEOUT is recorded as TIMEOUT
+    jobs = [(mode, method, n) for n in n_values for method in methods]
+    results = run_jobs(
+        jobs, _run_job, workers=workers, longest_first=longest_first,
+        cost=estimated_cost, skip=skip, on_result=on_result,
+        ready=lambda job, done: _smaller_points_done(job, done, jobs),
+    )
     with open("timings_fib_python.csv", "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(["N", "Iterative", "Recursive", "DP"])
+        writer.writerow(["N"] + [METHOD_COLUMNS[m] for m in methods])
         for n in n_values:
             row = [n]
             for method in methods:
-                stdout, stderr, code = run_command(f"python fibonacci.py {method} {n}")
-                if code == 0:
-                    row.append(stdout)
-                else:
-                    row.append("TIMEOUT")
+                cell = timing_cell(results[(mode, method, n)])
+                if not cell.startswith(("TIMEOUT", "PREDICTED")) and float(cell) > TIMEOUT:
+                    cell = "TIMEOUT"
+                row.append(cell)
             writer.writerow(row)
 
-    # Operations for small n
+    # Full statistics (samples, median, IQR, confidence interval) of the
+    # in-process or worker measurements, one row per (n, method)
+    if mode != "subprocess":
+        with open("timings_fib_python_stats.csv", "w", newline="") as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=STATS_HEADER)
+            writer.writeheader()
+            for n in n_values:
+                for method in methods:
+                    result = results[(mode, method, n)]
+                    if isinstance(result, dict):
+                        writer.writerow({"N": n, "Method": method, **result})
+
+    # Operations for small n, counted by the instrumented engines in fib_ops
     n_ops = 20
     with open("ops_fib_python.csv", "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(["N", "Iterative", "Recursive", "DP"])
+        writer.writerow(["N"] + [METHOD_COLUMNS[m] for m in methods])
         for n in range(1, n_ops + 1):
-            row = [n]
-            for method in ["print_iter", "print_rec", "print_dp"]:
-                stdout, stderr, code = run_command(f"python fibonacci.py {method} {n}")
-                if code == 0:
-                    lines = stdout.split('\n')
-                    ops_line = [line for line in lines if "Operations:" in line]
-                    if ops_line:
-                        ops = ops_line[0].split(": ")[1]
-                        row.append(ops)
-                    else:
-                        row.append("N/A")
-                else:
-                    row.append("TIMEOUT")
-            writer.writerow(row)
+            writer.writerow([n] + [count_ops(method, n)["additions"] for method in methods])
+
+def collect_startup(methods=None, out_file="startup_fib_python.csv"):
+    """
+    Times whole `python fibonacci.py <method> <n>` invocations, each doing a
+    single cold call (FIB_BENCH_BUDGET=0), and writes their wall time, the
+    compute time they report, the difference (interpreter start-up, imports,
+    exit) and the child's CPU time and peak RSS.
+    """
+    methods = methods or DEFAULT_METHODS
+    env = dict(os.environ, FIB_BENCH_BUDGET="0")
+    with open(out_file, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=STARTUP_HEADER)
+        writer.writeheader()
+        for n in STARTUP_N_VALUES:
+            for method in methods:
+                summary = time_startup([sys.executable, "fibonacci.py", method, str(n)],
+                                       STARTUP_RUNS, TIMEOUT, env)
+                if summary is not None:
+                    writer.writerow({"N": n, "Method": method, **summary})
 
 if __name__ == "__main__":
-    test_fibonacci()
+    parser = argparse.ArgumentParser(description="Collect Python Fibonacci timings and operation counts")
+    parser.add_argument(
+        "--methods", nargs="+", choices=list(METHOD_COLUMNS), default=DEFAULT_METHODS,
+        help="the methods to time (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--mode", choices=MODES, default="inprocess",
+        help="inprocess imports the engines directly; worker sends every data point to one "
+             "persistent `fibonacci.py worker` per benchmark process; subprocess launches one "
+             "interpreter per data point to include cold-start cost (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of benchmark workers, each pinned to its own core (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--longest-first", action="store_true",
+        help="dispatch the most expensive (method, n) jobs first"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="measure every point again instead of reusing cached results"
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        help="with --mode subprocess, let every fibonacci.py process resume from and add to the "
+             "on-disk checkpoint store in this directory (warm-checkpoint mode)"
+    )
+    parser.add_argument(
+        "--startup", action="store_true",
+        help="instead of the sweep, split whole-invocation wall time into start-up and "
+             "compute cost, into startup_fib_python.csv"
+    )
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="instead of the sweep, record tracemalloc peaks and peak RSS per method and n "
+             "into memory_fib_python.csv"
+    )
+    args = parser.parse_args()
+    if args.checkpoint_dir and args.mode != "subprocess":
+        parser.error("--checkpoint-dir needs --mode subprocess")
+    if args.startup:
+        collect_startup(args.methods)
+    elif args.memory:
+        collect_python_memory(args.methods)
+    else:
+        test_fibonacci(args.methods, args.mode, args.workers, args.longest_first, not args.no_cache,
+                       args.checkpoint_dir)